@@ -1,26 +1,13 @@
 """Freckle CLI - Command-line interface for dotfiles management."""
 
+import importlib
+import os
+import sys
+from typing import Dict, List, Optional, Set
+
 import typer
 
 from ..utils import setup_logging
-from . import (
-    config,
-    discover,
-    doctor,
-    fetch,
-    files,
-    git,
-    history,
-    init,
-    profile,
-    push,
-    restore,
-    save,
-    schedule,
-    status,
-    tools,
-    version,
-)
 
 # Create the main app
 app = typer.Typer(
@@ -44,25 +31,69 @@ def main_callback(
     setup_logging(verbose=verbose)
 
 
-# Register all commands
-init.register(app)
-save.register(app)
-push.register(app)
-fetch.register(app)
-files.register(app)
-status.register(app)
-git.register(app)
-history.register(app)
-profile.register(app)
-config.register(app)
-restore.register(app)
-schedule.register(app)
-tools.register(app)
-discover.register(app)
-doctor.register(app)
-version.register(app)
+# Top-level command name -> CLI module that registers it. Modules are
+# listed in the order their commands appear in --help.
+COMMAND_MODULES: Dict[str, str] = {
+    "init": "init",
+    "save": "save",
+    "push": "push",
+    "fetch": "fetch",
+    "track": "files",
+    "untrack": "files",
+    "propagate": "files",
+    "status": "status",
+    "changes": "git",
+    "history": "history",
+    "diff": "history",
+    "profile": "profile",
+    "config": "config",
+    "restore": "restore",
+    "schedule": "schedule",
+    "tools": "tools",
+    "discover": "discover",
+    "doctor": "doctor",
+    "version": "version",
+}
+
+_registered: Set[str] = set()
+
+
+def _requested_command(argv: List[str]) -> Optional[str]:
+    """Get the top-level command name from argv, if there is one."""
+    for arg in argv:
+        if not arg.startswith("-"):
+            return arg
+    return None
+
+
+def register_commands(argv: Optional[List[str]] = None) -> None:
+    """Import and register command modules.
+
+    Only the module providing the invoked command is imported, so simple
+    commands don't pay for loading every other one. Help, shell
+    completion and unknown commands register everything.
+
+    Args:
+        argv: Command-line arguments without the program name. If None,
+              all commands are registered.
+    """
+    command = _requested_command(argv) if argv is not None else None
+    if command in COMMAND_MODULES and not os.environ.get(
+        "_FRECKLE_COMPLETE"
+    ):
+        module_names = [COMMAND_MODULES[command]]
+    else:
+        module_names = list(dict.fromkeys(COMMAND_MODULES.values()))
+
+    for name in module_names:
+        if name in _registered:
+            continue
+        module = importlib.import_module(f".{name}", __name__)
+        module.register(app)
+        _registered.add(name)
 
 
 def main():
     """Main entry point for the freckle CLI."""
+    register_commands(sys.argv[1:])
     app()
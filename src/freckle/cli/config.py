@@ -1,14 +1,17 @@
 """Config management commands for freckle CLI."""
 
+import functools
 import os
-import platform
 import shutil
 import subprocess
+import sys
+from dataclasses import dataclass
 from pathlib import Path
-from typing import List
+from typing import Dict, List, NoReturn, Optional, Tuple
 
 import typer
 
+from ..dotfiles import DotfilesManager
 from .helpers import (
     CONFIG_FILENAME,
     CONFIG_PATH,
@@ -26,6 +29,9 @@ config_app = typer.Typer(
 )
 
 
+_IS_MAC = sys.platform == "darwin"
+
+
 def register(app: typer.Typer) -> None:
     """Register config command group with the app."""
     app.add_typer(config_app, name="config")
@@ -53,6 +59,45 @@ def config_edit():
     open_in_editor([CONFIG_PATH])
 
 
+@functools.lru_cache(maxsize=8)
+def _which(name: str) -> Optional[str]:
+    """Cached shutil.which, since each lookup stats every $PATH entry."""
+    return shutil.which(name)
+
+
+def _run_attached(*args: str) -> None:
+    """Run a program attached to the terminal, raising if it fails.
+
+    The executable is resolved to an absolute path and close_fds is off,
+    which lets subprocess launch it with posix_spawn instead of fork.
+
+    Raises:
+        FileNotFoundError: If the program isn't on PATH
+        subprocess.CalledProcessError: If it exits non-zero
+    """
+    executable = _which(args[0])
+    if executable is None:
+        raise FileNotFoundError(args[0])
+    subprocess.run([executable, *args[1:]], check=True, close_fds=False)
+
+
+def _exec_attached(*args: str) -> NoReturn:
+    """Replace freckle with a program, for the last step of a command.
+
+    Nothing runs after the program exits, so there's no point keeping
+    a parent process around just to wait for it.
+
+    Raises:
+        FileNotFoundError: If the program isn't on PATH
+    """
+    executable = _which(args[0])
+    if executable is None:
+        raise FileNotFoundError(args[0])
+    sys.stdout.flush()
+    sys.stderr.flush()
+    os.execv(executable, [executable, *args[1:]])
+
+
 def open_in_editor(files: List[Path]) -> None:
     """Open one or more files in the user's editor."""
     if not files:
@@ -67,26 +112,27 @@ def open_in_editor(files: List[Path]) -> None:
 
     if editor:
         try:
-            subprocess.run([editor, *file_args], check=True)
+            _run_attached(editor, *file_args)
             return
         except (subprocess.CalledProcessError, FileNotFoundError):
             pass  # Fall through to platform defaults
 
-    # Platform-specific fallbacks
-    is_mac = platform.system() == "Darwin"
-
-    if is_mac:
+    # Platform-specific fallbacks. $EDITOR is run as a child so a failure
+    # can fall through to these; the fallbacks are final, so the last
+    # program to run replaces freckle instead.
+    if _IS_MAC:
         # -W waits for the app to close, -t opens in default text editor
-        subprocess.run(["open", "-W", "-t", *file_args], check=True)
+        _exec_attached("open", "-W", "-t", *file_args)
     else:
-        if shutil.which("xdg-open"):
+        if _which("xdg-open"):
             # xdg-open only handles one file at a time
-            for f in file_args:
-                subprocess.run(["xdg-open", f], check=True)
-        elif shutil.which("nano"):
-            subprocess.run(["nano", *file_args], check=True)
-        elif shutil.which("vi"):
-            subprocess.run(["vi", *file_args], check=True)
+            for f in file_args[:-1]:
+                _run_attached("xdg-open", f)
+            _exec_attached("xdg-open", file_args[-1])
+        elif _which("nano"):
+            _exec_attached("nano", *file_args)
+        elif _which("vi"):
+            _exec_attached("vi", *file_args)
         else:
             plain("Could not find an editor. Files are at:")
             for f in file_args:
@@ -112,13 +158,19 @@ def get_tool_config_files(tool_name: str) -> List[Path]:
     if not config_files:
         return []
 
-    # Expand paths and check existence
+    home = env.home
     result = []
     for cfg in config_files:
-        path = Path(cfg).expanduser()
-        if not path.is_absolute():
-            path = env.home / cfg
-        result.append(path)
+        if cfg == "~" or cfg.startswith("~/"):
+            # Common case: join onto the resolved home directly instead
+            # of re-reading $HOME through expanduser for every entry
+            result.append(home / cfg[2:])
+        elif cfg.startswith("~"):
+            result.append(Path(cfg).expanduser())
+        elif os.path.isabs(cfg):
+            result.append(Path(cfg))
+        else:
+            result.append(home / cfg)
 
     return result
 
@@ -152,9 +204,11 @@ def config_open(
         muted(f"        - ~/.config/{tool_name}/config")
         raise typer.Exit(1)
 
-    # Filter to existing files
-    existing = [f for f in files if f.exists()]
-    missing = [f for f in files if not f.exists()]
+    # Split into existing and missing files, stat'ing each only once
+    existing: List[Path] = []
+    missing: List[Path] = []
+    for f in files:
+        (existing if f.exists() else missing).append(f)
 
     if missing:
         for f in missing:
@@ -176,74 +230,130 @@ def config_open(
     open_in_editor(existing)
 
 
-@config_app.command(name="check")
-def config_check():
-    """Check if config is consistent across all profile branches.
+@dataclass
+class ConfigBranches:
+    """The config file's blob on every profile branch."""
 
-    Compares the config file on the current branch to all other profile
-    branches. Reports any differences.
+    dotfiles: DotfilesManager
+    current_branch: str
+    profile_branches: List[str]
+    blob_ids: Dict[str, Optional[str]]
+    # Local branch tips, and origin's tips for profile branches that
+    # only exist there (e.g. right after a fresh clone)
+    heads: Dict[str, str]
+    remote_heads: Dict[str, str]
+
+    @property
+    def current_id(self) -> Optional[str]:
+        """Blob id of the config on the current branch."""
+        return self.blob_ids[self.current_branch]
+
+    @property
+    def other_branches(self) -> List[str]:
+        """Profile branches other than the current one."""
+        return [
+            b for b in self.profile_branches if b != self.current_branch
+        ]
+
+
+def _load_config_branches() -> Optional[ConfigBranches]:
+    """Resolve the config blob on every profile branch in one git call.
+
+    Shared setup for 'config check' and 'config propagate'. Equal blob
+    ids mean equal content, so no config needs to be read. A profile
+    branch with no local branch is read from origin's copy of it.
+
+    Returns:
+        None if no profiles are configured (after saying so).
+
+    Raises:
+        typer.Exit(1): If dotfiles aren't set up or the current branch
+            has no config file.
     """
     config = get_config()
     profiles = config.get_profiles()
 
     if not profiles:
         plain("No profiles configured.")
-        return
+        return None
 
     dotfiles, _ = require_dotfiles_ready(config)
 
-    # Get current branch
-    try:
-        result = dotfiles._git.run("rev-parse", "--abbrev-ref", "HEAD")
-        current_branch = result.stdout.strip()
-    except subprocess.CalledProcessError:
-        error("Failed to get current branch.")
-        raise typer.Exit(1)
-
-    # Get current config content
-    try:
-        git_path = f"{current_branch}:{CONFIG_FILENAME}"
-        result = dotfiles._git.run("show", git_path)
-        current_content = result.stdout
-    except subprocess.CalledProcessError:
+    # get_dotfiles_manager already resolved the checked-out branch
+    current_branch = dotfiles.branch
+
+    # Profile name = branch name
+    branches = list(dict.fromkeys([current_branch, *profiles]))
+    heads = dotfiles._git.get_branch_heads()
+    remote_heads: Dict[str, str] = {}
+    if any(b not in heads for b in branches):
+        remote_heads = dotfiles._git.get_branch_heads(remote="origin")
+
+    refs = [
+        f"refs/remotes/origin/{b}"
+        if b not in heads and b in remote_heads
+        else f"refs/heads/{b}"
+        for b in branches
+    ]
+    specs = [f"{ref}:{CONFIG_FILENAME}" for ref in refs]
+    ids = dotfiles._git.get_blob_ids(specs)
+    blob_ids = {b: ids[spec] for b, spec in zip(branches, specs)}
+
+    if blob_ids[current_branch] is None:
         error(f"No {CONFIG_FILENAME} found on current branch.")
         raise typer.Exit(1)
 
+    return ConfigBranches(
+        dotfiles=dotfiles,
+        current_branch=current_branch,
+        profile_branches=list(profiles),
+        blob_ids=blob_ids,
+        heads=heads,
+        remote_heads=remote_heads,
+    )
+
+
+@config_app.command(name="check")
+def config_check():
+    """Check if config is consistent across all profile branches.
+
+    Compares the config file on the current branch to all other profile
+    branches. Reports any differences.
+    """
+    branches = _load_config_branches()
+    if branches is None:
+        return
+
     plain(f"Checking {CONFIG_FILENAME} consistency...\n")
 
     consistent = []
     inconsistent = []
 
-    for name, profile in profiles.items():
-        branch = name  # Profile name = branch name
-
-        if branch == current_branch:
-            consistent.append((name, branch, "(current)"))
+    for branch in branches.profile_branches:
+        if branch == branches.current_branch:
+            consistent.append((branch, branch, "(current)"))
             continue
 
-        try:
-            result = dotfiles._git.run("show", f"{branch}:{CONFIG_FILENAME}")
-            other_content = result.stdout
-
-            if other_content == current_content:
-                consistent.append((name, branch, ""))
-            else:
-                inconsistent.append((name, branch))
-        except subprocess.CalledProcessError:
-            # Branch might not have config file yet
-            inconsistent.append((name, branch))
-
-    # Report results
-    for name, branch, note in consistent:
-        if note:
-            console.print(f"  [green]✓[/green] {name} ({branch}) {note}")
+        # Branch might not have config file yet
+        if branches.blob_ids[branch] == branches.current_id:
+            consistent.append((branch, branch, ""))
         else:
-            console.print(f"  [green]✓[/green] {name} ({branch})")
+            inconsistent.append((branch, branch))
+
+    # Report results in one write rather than one per profile
+    with console:
+        for name, branch, note in consistent:
+            if note:
+                console.print(
+                    f"  [green]✓[/green] {name} ({branch}) {note}"
+                )
+            else:
+                console.print(f"  [green]✓[/green] {name} ({branch})")
 
-    for name, branch in inconsistent:
-        console.print(
-            f"  [red]✗[/red] {name} ({branch}) - differs or missing"
-        )
+        for name, branch in inconsistent:
+            console.print(
+                f"  [red]✗[/red] {name} ({branch}) - differs or missing"
+            )
 
     if inconsistent:
         muted(
@@ -266,49 +376,36 @@ def config_propagate(
     """Propagate config to all profile branches.
 
     Copies the current branch's config to all other profile branches,
-    creating a commit on each.
+    creating a commit on each. Other branches are never checked out, so
+    local changes are left alone.
     """
-    config = get_config()
-    profiles = config.get_profiles()
-
-    if not profiles:
-        plain("No profiles configured.")
+    branches = _load_config_branches()
+    if branches is None:
         return
 
-    dotfiles, _ = require_dotfiles_ready(config)
+    dotfiles = branches.dotfiles
+    current_branch = branches.current_branch
+    current_id = branches.current_id
 
-    # Get current branch
-    try:
-        result = dotfiles._git.run("rev-parse", "--abbrev-ref", "HEAD")
-        current_branch = result.stdout.strip()
-    except subprocess.CalledProcessError:
-        error("Failed to get current branch.")
-        raise typer.Exit(1)
-
-    # Get current config content
-    try:
-        git_path = f"{current_branch}:{CONFIG_FILENAME}"
-        result = dotfiles._git.run("show", git_path)
-        current_content = result.stdout
-    except subprocess.CalledProcessError:
-        error(f"No {CONFIG_FILENAME} found on current branch.")
-        raise typer.Exit(1)
-
-    # Find branches to update
-    branches_to_update = []
-    for name, profile in profiles.items():
-        branch = name  # Profile name = branch name
-        if branch != current_branch:
-            branches_to_update.append((name, branch))
+    # Find branches to update (profile name = branch name)
+    branches_to_update = [
+        (branch, branch)
+        for branch in branches.other_branches
+        if branches.blob_ids[branch] != current_id
+    ]
 
     if not branches_to_update:
-        plain("No other branches to update.")
+        if branches.other_branches:
+            plain(f"{CONFIG_FILENAME} is already in sync on all branches.")
+        else:
+            plain("No other branches to update.")
         return
 
     n = len(branches_to_update)
-    plain(f"Will update {CONFIG_FILENAME} on {n} branch(es):")
-    for name, branch in branches_to_update:
-        muted(f"  - {name} ({branch})")
+    with console:
+        plain(f"Will update {CONFIG_FILENAME} on {n} branch(es):")
+        for name, branch in branches_to_update:
+            muted(f"  - {name} ({branch})")
 
     if dry_run:
         plain("\n--- Dry run, no changes made ---")
@@ -321,73 +418,53 @@ def config_propagate(
 
     plain("")
 
-    # Check for uncommitted changes (only tracked files)
-    try:
-        result = dotfiles._git.run("status", "--porcelain")
-        output = result.stdout.strip()
-        if output:
-            tracked_changes = [
-                line for line in output.split("\n")
-                if line and not line.startswith("??")
-            ]
-            has_changes = bool(tracked_changes)
-        else:
-            has_changes = False
-    except subprocess.CalledProcessError:
-        has_changes = False
-
-    stashed = False
-    if has_changes:
-        plain("Stashing local changes...")
-        try:
-            dotfiles._git.run(
-                "stash", "push", "-m", "freckle config propagate"
-            )
-            stashed = True
-        except subprocess.CalledProcessError:
-            error("Failed to stash changes.")
-            raise typer.Exit(1)
+    # Commit the current blob onto each branch with plumbing commands, so
+    # nothing is checked out and local changes don't need stashing
+    message = f"Sync {CONFIG_FILENAME} from {current_branch}"
 
+    new_commits: Dict[str, Tuple[str, Optional[str]]] = {}
+    created = []
     updated = []
     failed = []
 
-    try:
-        for name, branch in branches_to_update:
-            try:
-                # Checkout branch
-                dotfiles._git.run("checkout", branch)
-
-                # Write config file
-                target_config = dotfiles.work_tree / CONFIG_FILENAME
-                target_config.write_text(current_content)
-
-                # Stage and commit
-                dotfiles._git.run("add", CONFIG_FILENAME)
-                dotfiles._git.run(
-                    "commit", "-m",
-                    f"Sync {CONFIG_FILENAME} from {current_branch}"
-                )
-
-                updated.append((name, branch))
-                success(f"{name} ({branch})", prefix="  ✓")
-
-            except subprocess.CalledProcessError:
-                failed.append((name, branch))
-                error(f"{name} ({branch}) - failed", prefix="  ✗")
-
-    finally:
-        # Return to original branch
+    for name, branch in branches_to_update:
+        # A branch only on origin is created locally on top of origin's
+        # tip, like checking it out would; None asks update-ref to
+        # create it rather than move it
+        expected = branches.heads.get(branch)
+        parent = expected or branches.remote_heads.get(branch)
         try:
-            dotfiles._git.run("checkout", current_branch)
-        except subprocess.CalledProcessError:
-            warning(f"Failed to return to {current_branch}")
-
-        # Restore stashed changes
-        if stashed:
-            try:
-                dotfiles._git.run("stash", "pop")
-            except subprocess.CalledProcessError:
-                warning("Failed to restore stashed changes")
+            if parent is None:
+                raise ValueError(f"no branch {branch}")
+            commit = dotfiles._git.commit_blob(
+                parent, CONFIG_FILENAME, current_id, message
+            )
+            new_commits[branch] = (commit, expected)
+            if expected is None:
+                created.append(branch)
+            updated.append((name, branch))
+        except (subprocess.CalledProcessError, ValueError):
+            failed.append((name, branch))
+            error(f"{name} ({branch}) - failed", prefix="  ✗")
+
+    # Move all branch refs in a single atomic transaction
+    if not dotfiles._git.update_branches(new_commits):
+        for name, branch in updated:
+            error(f"{name} ({branch}) - failed", prefix="  ✗")
+        failed.extend(updated)
+        updated = []
+        created = []
+
+    # New local branches track origin, as a checkout would have set up
+    for branch in created:
+        dotfiles._git.run_bare(
+            "branch", f"--set-upstream-to=origin/{branch}", branch,
+            check=False,
+        )
+
+    with console:
+        for name, branch in updated:
+            success(f"{name} ({branch})", prefix="  ✓")
 
     plain("")
 
@@ -1,6 +1,8 @@
 """Discover command for finding installed programs on the system."""
 
-from typing import List, Optional
+import json
+from collections import defaultdict
+from typing import Dict, List, Optional
 
 import typer
 
@@ -104,7 +106,9 @@ def discover(
     elif format_ == "yaml":
         _output_yaml(report)
     else:
-        _output_default(report, filtered_count)
+        # Render the whole report in one write rather than one per line
+        with console:
+            _output_default(report, filtered_count)
 
 
 def _output_default(report, filtered_count: int = 0) -> None:
@@ -128,9 +132,9 @@ def _output_default(report, filtered_count: int = 0) -> None:
         success("All discovered programs are tracked!", prefix="  ✓")
     else:
         # Group by source
-        by_source = {}
+        by_source: Dict[str, List[DiscoveredProgram]] = defaultdict(list)
         for prog in report.untracked:
-            by_source.setdefault(prog.source, []).append(prog)
+            by_source[prog.source].append(prog)
 
         for src, progs in sorted(by_source.items()):
             plain(f"  {src} ({len(progs)}):")
@@ -168,8 +172,6 @@ def _output_yaml(report) -> None:
 
 def _output_json(report) -> None:
     """Output discovery results as JSON."""
-    import json
-
     data = {
         "summary": {
             "managed": len(report.managed),
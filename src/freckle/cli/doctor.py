@@ -1,17 +1,21 @@
 """Doctor command for health check diagnostics."""
 
 import json
+import os
 import subprocess
+import time
+import urllib.error
 import urllib.request
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import List, Optional, Set
+from typing import Dict, List, Optional, Set, Tuple
 
 import typer
 import yaml
 
-from ..config import Config
-from ..tools_registry import get_tools_from_config
-from ..utils import get_version
+from ..config import load_yaml
+from ..tools_registry import VersionCache, get_tools_from_config
+from ..utils import get_cache_dir, get_version
 from .helpers import (
     CONFIG_PATH,
     get_config,
@@ -77,6 +81,25 @@ class BranchAnalysis:
     in_config: bool = True
 
 
+@dataclass
+class RefInfo:
+    """Tip commit details for a branch ref."""
+
+    commit: str
+    commit_time: str
+    commit_msg: str
+
+
+@dataclass
+class ToolsProbe:
+    """Installed state of the current profile's tools."""
+
+    configured: int
+    results: List[Tuple[str, bool, Optional[str]]] = field(
+        default_factory=list
+    )
+
+
 @dataclass
 class RemoteBranch:
     """A remote branch without a local tracking branch."""
@@ -93,8 +116,8 @@ class RemoteBranch:
 def _diff_configs(current: str, other: str) -> ConfigDiff:
     """Compute semantic diff between two config strings."""
     try:
-        current_data = yaml.safe_load(current) or {}
-        other_data = yaml.safe_load(other) or {}
+        current_data = load_yaml(current) or {}
+        other_data = load_yaml(other) or {}
     except yaml.YAMLError:
         return ConfigDiff()
 
@@ -114,40 +137,59 @@ def _diff_configs(current: str, other: str) -> ConfigDiff:
     )
 
 
+def _get_refs(dotfiles) -> Dict[str, RefInfo]:
+    """Get tip details for all local and origin branches in one git call.
+
+    Returns:
+        Dictionary keyed by full ref name (e.g. "refs/heads/main")
+    """
+    try:
+        result = dotfiles._git.run(
+            "for-each-ref",
+            "--format=%(refname)%09%(objectname:short)"
+            "%09%(authordate:relative)%09%(subject)",
+            "refs/heads/",
+            "refs/remotes/origin/",
+        )
+    except subprocess.CalledProcessError:
+        return {}
+
+    refs = {}
+    for line in result.stdout.splitlines():
+        parts = line.split("\t", 3)
+        if len(parts) == 4:
+            refname, commit, commit_time, commit_msg = parts
+            refs[refname] = RefInfo(commit, commit_time, commit_msg)
+    return refs
+
+
 def _analyze_branch(
-    dotfiles, branch: str, current_config: Optional[str], profiles: set
+    dotfiles,
+    branch: str,
+    refs: Dict[str, RefInfo],
+    branch_config: Optional[str],
+    current_config: Optional[str],
+    profiles: set,
 ) -> BranchAnalysis:
     """Analyze a single branch's state."""
     # Get local HEAD info
-    try:
-        local_head = dotfiles._git.run(
-            "rev-parse", "--short", branch
-        ).stdout.strip()
-    except subprocess.CalledProcessError:
-        local_head = "unknown"
-
-    try:
-        local_commit_msg = dotfiles._git.run(
-            "log", "-1", "--format=%s", branch
-        ).stdout.strip()
+    local = refs.get(f"refs/heads/{branch}")
+    if local:
+        local_head = local.commit
+        local_commit_time = local.commit_time
+        local_commit_msg = local.commit_msg
         # Truncate long messages
         if len(local_commit_msg) > 50:
             local_commit_msg = local_commit_msg[:47] + "..."
-    except subprocess.CalledProcessError:
+    else:
+        local_head = "unknown"
         local_commit_msg = ""
-
-    try:
-        local_commit_time = dotfiles._git.run(
-            "log", "-1", "--format=%ar", branch
-        ).stdout.strip()
-    except subprocess.CalledProcessError:
         local_commit_time = ""
 
     # Check remote tracking
-    remote = _get_remote_status(dotfiles, branch)
+    remote = _get_remote_status(dotfiles, branch, refs)
 
     # Check config on this branch
-    branch_config = _get_config_from_branch(dotfiles, branch)
     if current_config is None or branch_config is None:
         config_matches = True
         config_diff = None
@@ -170,14 +212,19 @@ def _analyze_branch(
     )
 
 
-def _get_remote_status(dotfiles, branch: str) -> RemoteStatus:
+def _get_remote_status(
+    dotfiles, branch: str, refs: Dict[str, RefInfo]
+) -> RemoteStatus:
     """Get remote tracking status for a branch."""
-    try:
-        remote_head = dotfiles._git.run(
-            "rev-parse", "--short", f"origin/{branch}"
-        ).stdout.strip()
-    except subprocess.CalledProcessError:
+    remote_ref = refs.get(f"refs/remotes/origin/{branch}")
+    if remote_ref is None:
         return RemoteStatus(exists=False)
+    remote_head = remote_ref.commit
+
+    # Same tip means nothing to count, so skip the rev-list
+    local_ref = refs.get(f"refs/heads/{branch}")
+    if local_ref is not None and local_ref.commit == remote_head:
+        return RemoteStatus(exists=True, commit=remote_head)
 
     # Calculate ahead/behind
     try:
@@ -201,39 +248,22 @@ def _get_remote_status(dotfiles, branch: str) -> RemoteStatus:
         return RemoteStatus(exists=True, commit=remote_head)
 
 
-def _get_remote_only_branches(dotfiles) -> List[RemoteBranch]:
+def _get_remote_only_branches(
+    refs: Dict[str, RefInfo]
+) -> List[RemoteBranch]:
     """Find remote branches with no local tracking branch."""
-    # Get all remote branches
-    try:
-        result = dotfiles._git.run(
-            "branch", "-r", "--format=%(refname:short)"
-        )
-        remote_branches = [
-            b.replace("origin/", "")
-            for b in result.stdout.strip().split("\n")
-            if b.startswith("origin/") and "HEAD" not in b
-        ]
-    except subprocess.CalledProcessError:
-        return []
-
-    # Get local branches
-    local_branches = _get_local_branches(dotfiles)
-
-    # Find remote-only
+    prefix = "refs/remotes/origin/"
     remote_only = []
-    for branch in remote_branches:
-        if branch not in local_branches:
-            try:
-                last_commit = dotfiles._git.run(
-                    "log", "-1", "--format=%ar", f"origin/{branch}"
-                ).stdout.strip()
-            except subprocess.CalledProcessError:
-                last_commit = "unknown"
-
-            remote_only.append(RemoteBranch(
-                name=branch,
-                last_commit_time=last_commit,
-            ))
+    for refname, ref in refs.items():
+        if not refname.startswith(prefix):
+            continue
+        branch = refname[len(prefix):]
+        if "HEAD" in branch or f"refs/heads/{branch}" in refs:
+            continue
+        remote_only.append(RemoteBranch(
+            name=branch,
+            last_commit_time=ref.commit_time,
+        ))
 
     return remote_only
 
@@ -374,6 +404,11 @@ def doctor(
     verbose: bool = typer.Option(
         False, "--verbose", "-v", help="Show detailed output"
     ),
+    offline: bool = typer.Option(
+        False,
+        "--offline",
+        help="Skip network checks (also set by FRECKLE_OFFLINE=1)",
+    ),
 ):
     """Run health checks and show system status.
 
@@ -386,15 +421,30 @@ def doctor(
     Example:
         freckle doctor
         freckle doctor --verbose
+        freckle doctor --offline
     """
     issues = []
     warnings = []
 
+    offline = offline or os.environ.get("FRECKLE_OFFLINE") == "1"
+
+    # Start the slow, subprocess- and network-bound probes now so they
+    # overlap with each other and with the local checks below; each
+    # section still prints in order once its result is needed
+    executor = ThreadPoolExecutor(max_workers=3)
+    tools_future = executor.submit(_probe_tools, verbose)
+    latest_future: Optional["Future[Optional[str]]"] = None
+    remote_future: Optional["Future[bool]"] = None
+    if not offline:
+        latest_future = executor.submit(_get_latest_version)
+        remote_future = executor.submit(_probe_remote)
+    executor.shutdown(wait=False)
+
     plain("Running freckle health check...\n")
 
     # Check freckle version
     plain("Freckle:")
-    version_warnings = _check_version(verbose)
+    version_warnings = _check_version(verbose, latest_future)
     warnings.extend(version_warnings)
 
     plain("")
@@ -416,7 +466,7 @@ def doctor(
 
     # Check dotfiles
     plain("Dotfiles:")
-    df_issues, df_warnings = _check_dotfiles(verbose)
+    df_issues, df_warnings = _check_dotfiles(verbose, remote_future)
     issues.extend(df_issues)
     warnings.extend(df_warnings)
 
@@ -432,7 +482,7 @@ def doctor(
 
     # Check tools
     plain("Tools:")
-    tool_issues, tool_warnings = _check_tools(verbose)
+    tool_issues, tool_warnings = _check_tools(verbose, tools_future)
     issues.extend(tool_issues)
     warnings.extend(tool_warnings)
 
@@ -458,25 +508,93 @@ def doctor(
         success("All checks passed!")
 
 
+PYPI_URL = "https://pypi.org/pypi/freckle/json"
+
+# How long a cached PyPI answer is trusted before revalidating it
+PYPI_CACHE_TTL = 3600
+
+
 def _get_latest_version() -> Optional[str]:
-    """Fetch the latest version from PyPI."""
+    """Fetch the latest version from PyPI.
+
+    The answer is cached in ~/.cache/freckle/pypi.json. A fresh cache is
+    used without any request; a stale one is revalidated with its
+    ETag/Last-Modified so an unchanged release costs only a 304.
+    """
+    cache_path = get_cache_dir() / "pypi.json"
     try:
-        url = "https://pypi.org/pypi/freckle/json"
-        with urllib.request.urlopen(url, timeout=5) as response:
+        cached = json.loads(cache_path.read_text())
+    except (OSError, ValueError):
+        cached = None
+    if not isinstance(cached, dict):
+        cached = {}
+
+    version = cached.get("version")
+    etag = cached.get("etag")
+    last_modified = cached.get("last_modified")
+    fetched_at = cached.get("fetched_at")
+    if (
+        version
+        and isinstance(fetched_at, (int, float))
+        and 0 <= time.time() - fetched_at < PYPI_CACHE_TTL
+    ):
+        return version
+
+    request = urllib.request.Request(PYPI_URL)
+    if version:
+        if etag:
+            request.add_header("If-None-Match", etag)
+        if last_modified:
+            request.add_header("If-Modified-Since", last_modified)
+
+    try:
+        with urllib.request.urlopen(request, timeout=5) as response:
             data = json.loads(response.read().decode())
-            return data.get("info", {}).get("version")
+            version = data.get("info", {}).get("version")
+            etag = response.headers.get("ETag")
+            last_modified = response.headers.get("Last-Modified")
+    except urllib.error.HTTPError as e:
+        if e.code != 304 or not version:
+            return None
     except Exception:
         return None
 
+    if version:
+        data = {
+            "version": version,
+            "etag": etag,
+            "last_modified": last_modified,
+            "fetched_at": time.time(),
+        }
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_name(cache_path.name + ".tmp")
+            tmp_path.write_text(json.dumps(data))
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            pass
+    return version
+
 
-def _check_version(verbose: bool) -> list[str]:
-    """Check if freckle is up to date."""
+def _check_version(
+    verbose: bool, latest_future: Optional["Future[Optional[str]]"]
+) -> list[str]:
+    """Check if freckle is up to date.
+
+    The latest PyPI version comes from latest_future, or the check is
+    skipped when it is None (offline).
+    """
     warnings = []
 
     current = get_version()
     plain(f"  Current version: {current}")
 
-    latest = _get_latest_version()
+    if latest_future is None:
+        if verbose:
+            muted("  Update check skipped (offline)")
+        return warnings
+
+    latest = latest_future.result()
     if latest:
         if latest != current:
             warning(f"New version available: {latest}", prefix="  ⚠")
@@ -504,6 +622,10 @@ def _check_prerequisites(verbose: bool) -> list[str]:
     return issues
 
 
+# Top-level keys understood in .freckle.yaml
+KNOWN_KEYS = frozenset({"vars", "dotfiles", "profiles", "tools", "secrets"})
+
+
 def _check_config(verbose: bool) -> tuple[list[str], list[str]]:
     """Check config file validity."""
     issues = []
@@ -517,7 +639,8 @@ def _check_config(verbose: bool) -> tuple[list[str], list[str]]:
     success(f"Config file: {CONFIG_PATH}", prefix="  ✓")
 
     try:
-        config = Config(CONFIG_PATH)
+        # Shares the parse with the later checks' get_config() calls
+        config = get_config(CONFIG_PATH)
         success("Valid YAML syntax", prefix="  ✓")
     except Exception as e:
         error(f"Invalid YAML: {e}", prefix="  ✗")
@@ -525,8 +648,7 @@ def _check_config(verbose: bool) -> tuple[list[str], list[str]]:
         return issues, warnings
 
     # Check for unknown keys
-    known_keys = {"vars", "dotfiles", "profiles", "tools", "secrets"}
-    unknown_keys = set(config.data.keys()) - known_keys
+    unknown_keys = [key for key in config.data if key not in KNOWN_KEYS]
     if unknown_keys:
         for key in unknown_keys:
             warning(f"Unknown key: '{key}'", prefix="  ⚠")
@@ -543,8 +665,27 @@ def _check_config(verbose: bool) -> tuple[list[str], list[str]]:
     return issues, warnings
 
 
-def _check_dotfiles(verbose: bool) -> tuple[list[str], list[str]]:
-    """Check dotfiles repository status."""
+def _probe_remote() -> bool:
+    """Check whether the dotfiles remote can be reached."""
+    try:
+        dotfiles = get_dotfiles_manager(get_config())
+        if not dotfiles:
+            return False
+        dotfiles._git.run("fetch", "--dry-run")
+    except Exception:
+        return False
+    return True
+
+
+def _check_dotfiles(
+    verbose: bool, remote_future: Optional["Future[bool]"]
+) -> tuple[list[str], list[str]]:
+    """Check dotfiles repository status.
+
+    Remote reachability comes from remote_future, which doctor starts
+    up front so the fetch overlaps with the other checks. It is None
+    when running offline.
+    """
     issues = []
     warnings = []
 
@@ -570,51 +711,64 @@ def _check_dotfiles(verbose: bool) -> tuple[list[str], list[str]]:
         issues.append("Dotfiles manager init failed")
         return issues, warnings
 
-    # Check current branch
+    # One status call reports both the branch (its "## " header line)
+    # and the tracked changes, ignoring untracked files
     try:
-        result = dotfiles._git.run("rev-parse", "--abbrev-ref", "HEAD")
-        branch = result.stdout.strip()
-        success(f"Branch: {branch}", prefix="  ✓")
+        result = dotfiles._git.run(
+            "status", "--porcelain", "--branch", "--untracked-files=no"
+        )
+        output: Optional[str] = result.stdout
     except subprocess.CalledProcessError:
+        output = None
+
+    # Check current branch. The changes are kept as one string: only
+    # their count and the first few lines are ever shown.
+    if output and output.startswith("## "):
+        header, _, tracked_changes = output.partition("\n")
+        branch = _parse_branch_header(header)
+        success(f"Branch: {branch}", prefix="  ✓")
+    else:
         warning("Could not determine branch", prefix="  ⚠")
         warnings.append("Could not determine current branch")
-        branch = None
+        tracked_changes = output
 
     # Check remote status
-    try:
-        dotfiles._git.run("fetch", "--dry-run")
+    if remote_future is None:
+        muted("  Remote check skipped (offline)")
+    elif remote_future.result():
         success("Remote accessible", prefix="  ✓")
-    except subprocess.CalledProcessError:
+    else:
         warning("Could not reach remote", prefix="  ⚠")
         warnings.append("Remote not accessible")
 
     # Check for local changes (only tracked files, ignore untracked)
-    try:
-        result = dotfiles._git.run("status", "--porcelain")
-        output = result.stdout.strip()
-        all_changes = output.split("\n") if output else []
-        # Filter out untracked files (lines starting with ??)
-        tracked_changes = [
-            line for line in all_changes
-            if line and not line.startswith("??")
-        ]
-        if tracked_changes:
-            num_changes = len(tracked_changes)
-            warning(f"{num_changes} modified file(s)", prefix="  ⚠")
-            warnings.append(f"{num_changes} uncommitted changes")
-            if verbose:
-                for line in tracked_changes[:5]:
-                    muted(f"      {line}")
-                if num_changes > 5:
-                    muted(f"      ... and {num_changes - 5} more")
-        else:
-            success("Working tree clean", prefix="  ✓")
-    except subprocess.CalledProcessError:
-        pass
+    if tracked_changes and not tracked_changes.isspace():
+        tracked_changes = tracked_changes.rstrip("\n")
+        num_changes = tracked_changes.count("\n") + 1
+        warning(f"{num_changes} modified file(s)", prefix="  ⚠")
+        warnings.append(f"{num_changes} uncommitted changes")
+        if verbose:
+            for line in tracked_changes.split("\n", 5)[:5]:
+                muted(f"      {line}")
+            if num_changes > 5:
+                muted(f"      ... and {num_changes - 5} more")
+    elif tracked_changes is not None:
+        success("Working tree clean", prefix="  ✓")
 
     return issues, warnings
 
 
+def _parse_branch_header(line: str) -> str:
+    """Get the branch name from a 'git status --branch' header line."""
+    header = line[3:]
+    for prefix in ("No commits yet on ", "Initial commit on "):
+        if header.startswith(prefix):
+            return header[len(prefix):]
+    if header.startswith("HEAD (no branch)"):
+        return "HEAD"
+    return header.split("...", 1)[0]
+
+
 def _check_branches(verbose: bool) -> tuple[list[str], list[str]]:
     """Comprehensive branch analysis: local, remote, config alignment."""
     issues = []
@@ -630,31 +784,49 @@ def _check_branches(verbose: bool) -> tuple[list[str], list[str]]:
         muted("  (skipped - no dotfiles manager)")
         return issues, warnings
 
-    # Get current branch
-    try:
-        result = dotfiles._git.run("rev-parse", "--abbrev-ref", "HEAD")
-        current_branch = result.stdout.strip()
-    except subprocess.CalledProcessError:
-        current_branch = None
-
-    # Get current config content for comparison
-    current_config = None
-    if current_branch:
-        current_config = _get_config_from_branch(dotfiles, current_branch)
+    # get_dotfiles_manager already read the checked-out branch from HEAD
+    current_branch = dotfiles.branch
 
-    # Get all local branches
-    local_branches = _get_local_branches(dotfiles)
+    # Get all local and origin branches with their tip commits
+    refs = _get_refs(dotfiles)
+    local_branches = [
+        refname[len("refs/heads/"):]
+        for refname in refs
+        if refname.startswith("refs/heads/")
+    ]
     if not local_branches:
         muted("  No local branches found")
         return issues, warnings
 
+    # Read every branch's config (and the current one, for comparison)
+    branches = list(local_branches)
+    if current_branch and current_branch not in branches:
+        branches.append(current_branch)
+    tips = {
+        ref.commit if ref else None
+        for ref in (refs.get(f"refs/heads/{b}") for b in branches)
+    }
+    if len(tips) == 1:
+        # Every branch is at the same commit, so configs can't differ
+        branch_configs = dict.fromkeys(branches)
+    else:
+        branch_configs = _get_configs_from_branches(dotfiles, branches)
+    current_config = branch_configs.get(current_branch)
+
     # Get profiles from config
     profiles = set(config.get_profiles().keys())
 
     # Analyze each local branch
     branch_analyses = []
     for branch in local_branches:
-        analysis = _analyze_branch(dotfiles, branch, current_config, profiles)
+        analysis = _analyze_branch(
+            dotfiles,
+            branch,
+            refs,
+            branch_configs[branch],
+            current_config,
+            profiles,
+        )
         branch_analyses.append(analysis)
 
     # Print branch analysis
@@ -665,58 +837,64 @@ def _check_branches(verbose: bool) -> tuple[list[str], list[str]]:
     warnings.extend(branch_warnings)
 
     # Check for remote-only branches
-    remote_only = _get_remote_only_branches(dotfiles)
+    remote_only = _get_remote_only_branches(refs)
     remote_warnings = _print_remote_only_branches(remote_only, verbose)
     warnings.extend(remote_warnings)
 
     return issues, warnings
 
 
-def _get_config_from_branch(dotfiles, branch: str) -> Optional[str]:
-    """Get freckle config content from a branch, checking both extensions."""
-    for ext in (".freckle.yaml", ".freckle.yml"):
-        try:
-            return dotfiles._git.run("show", f"{branch}:{ext}").stdout
-        except subprocess.CalledProcessError:
-            continue
-    return None
+def _get_configs_from_branches(
+    dotfiles, branches: List[str]
+) -> Dict[str, Optional[str]]:
+    """Get freckle config content from several branches at once.
+
+    Both extensions are looked up for every branch in a single
+    'git cat-file --batch' call; .freckle.yaml wins over .freckle.yml.
+    """
+    exts = (".freckle.yaml", ".freckle.yml")
+    contents = dotfiles._git.read_blobs(
+        [f"{branch}:{ext}" for branch in branches for ext in exts]
+    )
+    configs: Dict[str, Optional[str]] = dict.fromkeys(branches)
+    for branch in branches:
+        for ext in exts:
+            content = contents[f"{branch}:{ext}"]
+            if content is not None:
+                configs[branch] = content
+                break
+    return configs
 
 
-def _get_local_branches(dotfiles) -> list[str]:
-    """Get all local branches in the dotfiles repo."""
-    try:
-        result = dotfiles._git.run("branch", "--list")
-        branches = [
-            b.strip().lstrip("* ")
-            for b in result.stdout.split("\n")
-            if b.strip()
-        ]
-        return branches
-    except subprocess.CalledProcessError:
-        return []
+def _probe_tool(
+    tool, versions: Optional[VersionCache]
+) -> tuple[bool, Optional[str]]:
+    """Check whether a tool is installed, and its version if asked."""
+    if not tool.is_installed():
+        return False, None
+    return True, versions.get_version(tool) if versions else None
 
 
-def _check_tools(verbose: bool) -> tuple[list[str], list[str]]:
-    """Check tool installation status."""
-    issues = []
-    warnings = []
+def _probe_tools(verbose: bool) -> Optional[ToolsProbe]:
+    """Probe the current profile's tools.
+
+    Runs in the background while doctor's other sections are checked;
+    printing is left to _check_tools.
 
+    Returns:
+        The probe results, or None if the config could not be loaded
+    """
     try:
         config = get_config()
     except Exception:
-        error("Could not load config", prefix="  ✗")
-        issues.append("Config load failed")
-        return issues, warnings
+        return None
 
     registry = get_tools_from_config(config)
     all_tools = registry.list_tools()
-
-    if not all_tools:
-        plain("  No tools configured")
-        return issues, warnings
+    tools = all_tools
 
     # Filter by active profile's modules
-    dotfiles = get_dotfiles_manager(config)
+    dotfiles = get_dotfiles_manager(config) if all_tools else None
     if dotfiles:
         from .profile.helpers import get_current_branch
         current_branch = get_current_branch(config=config, dotfiles=dotfiles)
@@ -724,32 +902,65 @@ def _check_tools(verbose: bool) -> tuple[list[str], list[str]]:
             active_modules = config.get_profile_modules(current_branch)
             if active_modules:
                 tools = [t for t in all_tools if t.name in active_modules]
-            else:
-                tools = all_tools
-        else:
-            tools = all_tools
-    else:
-        tools = all_tools
 
     if not tools:
+        return ToolsProbe(configured=len(all_tools))
+
+    # Probing spawns a process per tool (verify command, --version), so
+    # overlap the waits; map keeps the results in config order
+    versions = VersionCache() if verbose else None
+    with ThreadPoolExecutor(max_workers=min(8, len(tools))) as executor:
+        probes = list(
+            executor.map(lambda t: _probe_tool(t, versions), tools)
+        )
+    if versions:
+        versions.save()
+
+    return ToolsProbe(
+        configured=len(all_tools),
+        results=[
+            (tool.name, is_installed, version)
+            for tool, (is_installed, version) in zip(tools, probes)
+        ],
+    )
+
+
+def _check_tools(
+    verbose: bool, probe_future: "Future[Optional[ToolsProbe]]"
+) -> tuple[list[str], list[str]]:
+    """Check tool installation status from the background probe."""
+    issues = []
+    warnings = []
+
+    probe = probe_future.result()
+    if probe is None:
+        error("Could not load config", prefix="  ✗")
+        issues.append("Config load failed")
+        return issues, warnings
+
+    if not probe.configured:
+        plain("  No tools configured")
+        return issues, warnings
+
+    if not probe.results:
         plain("  No tools for current profile")
         return issues, warnings
 
     installed = 0
     not_installed = []
 
-    for tool in tools:
-        if tool.is_installed():
+    for name, is_installed, version in probe.results:
+        if is_installed:
             installed += 1
             if verbose:
-                version = tool.get_version() or "installed"
+                version = version or "installed"
                 if len(version) > 30:
                     version = version[:27] + "..."
-                success(f"{tool.name}: {version}", prefix="  ✓")
+                success(f"{name}: {version}", prefix="  ✓")
         else:
-            not_installed.append(tool.name)
+            not_installed.append(name)
             if verbose:
-                error(f"{tool.name}: not installed", prefix="  ✗")
+                error(f"{name}: not installed", prefix="  ✗")
 
     if not verbose:
         if installed > 0:
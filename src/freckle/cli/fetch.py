@@ -84,5 +84,7 @@ def fetch(
                 "use 'freckle restore --list' to recover)"
             )
 
-    dotfiles.force_checkout()
+    # get_detailed_status has just fetched, so reset without a second
+    # round trip to the remote
+    dotfiles.force_checkout(fetch=False)
     success("Fetched latest from cloud.")
@@ -85,6 +85,10 @@ def track(
     if not home_relative_files:
         raise typer.Exit(1)
 
+    # The same file can be named twice (e.g. .zshrc and ~/.zshrc); scan,
+    # stage and report it once
+    home_relative_files = list(dict.fromkeys(home_relative_files))
+
     # Check for secrets unless --force is used
     if not force:
         scanner = get_secret_scanner(config)
@@ -172,17 +176,22 @@ def untrack(
     removed = []
     skipped = []
 
-    for f in home_relative_files:
-        try:
-            if delete:
-                # Remove from git and delete file
-                dotfiles._git.run("rm", f)
-            else:
-                # Remove from git but keep file
-                dotfiles._git.run("rm", "--cached", f)
-            removed.append(f)
-        except subprocess.CalledProcessError as e:
-            skipped.append((f, str(e)))
+    # --delete removes from git and deletes the file; otherwise the file
+    # is kept and only dropped from the index
+    rm_args = ["rm"] if delete else ["rm", "--cached"]
+
+    # git rm is all-or-nothing, so try every file in one call and only
+    # go file by file to find out which ones failed
+    try:
+        dotfiles._git.run(*rm_args, *home_relative_files)
+        removed = home_relative_files
+    except subprocess.CalledProcessError:
+        for f in home_relative_files:
+            try:
+                dotfiles._git.run(*rm_args, f)
+                removed.append(f)
+            except subprocess.CalledProcessError as e:
+                skipped.append((f, str(e)))
 
     if removed:
         if delete:
@@ -312,16 +321,11 @@ def propagate(
 
     # Check for uncommitted changes
     try:
-        result = dotfiles._git.run("status", "--porcelain")
-        output = result.stdout.strip()
-        if output:
-            tracked_changes = [
-                line for line in output.split("\n")
-                if line and not line.startswith("??")
-            ]
-            has_changes = bool(tracked_changes)
-        else:
-            has_changes = False
+        result = dotfiles._git.run(
+            "status", "--porcelain", "--untracked-files=no"
+        )
+        # Untracked files aren't listed, so any output is a change
+        has_changes = bool(result.stdout) and not result.stdout.isspace()
     except subprocess.CalledProcessError:
         has_changes = False
 
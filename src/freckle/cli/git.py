@@ -1,7 +1,7 @@
 """Git convenience commands for freckle CLI."""
 
+import os
 import subprocess
-from pathlib import Path
 from typing import List, Optional
 
 import typer
@@ -34,26 +34,31 @@ def changes(
     dotfiles, _ = require_dotfiles_ready(config)
 
     try:
-        args = ["diff", "--color=always"]
+        # Only ask git for ANSI colors when they'll reach a terminal
+        color = "always" if console.is_terminal else "never"
+        args = ["diff", f"--color={color}"]
         if staged:
             args.append("--staged")
 
         if files:
-            # Convert paths to home-relative
+            # Convert paths to home-relative using plain strings, since
+            # shell globs can expand to hundreds of arguments
+            home = str(env.home)
+            home_prefix = home + os.sep
+            cwd = os.getcwd()
             for f in files:
-                path = Path(f).expanduser()
-                if not path.is_absolute():
-                    path = Path.cwd() / path
-                path = path.resolve()
-                try:
-                    relative = path.relative_to(env.home)
-                    args.append(str(relative))
-                except ValueError:
+                path = os.path.join(cwd, os.path.expanduser(f))
+                path = os.path.realpath(path)
+                if path == home:
+                    args.append(".")
+                elif path.startswith(home_prefix):
+                    args.append(path[len(home_prefix):])
+                else:
                     args.append(f)
 
         result = dotfiles._git.run(*args)
 
-        if result.stdout.strip():
+        if result.stdout and not result.stdout.isspace():
             plain("\nChanges not yet backed up:\n")
             console.print(result.stdout)
         else:
@@ -1,6 +1,9 @@
 """Shared helper functions for CLI commands."""
 
+import functools
+import hashlib
 import logging
+import os
 import shutil
 import subprocess
 from pathlib import Path
@@ -9,7 +12,7 @@ from typing import List, Optional, Tuple
 import typer
 
 from ..config import Config
-from ..dotfiles import DotfilesManager
+from ..dotfiles import BareGitRepo, DotfilesManager
 from ..system import Environment
 
 # Global environment instance
@@ -40,26 +43,79 @@ CONFIG_FILENAME = CONFIG_FILENAMES[0]
 CONFIG_PATH = get_config_path()
 
 
-def get_config() -> Config:
-    """Load config from ~/.freckle.yaml or ~/.freckle.yml."""
-    return Config(get_config_path(), env=env)
+# Last parsed config, keyed on its path and a hash of its content
+_config_cache: Optional[Tuple[Path, bytes, Config]] = None
+
+
+def get_config(path: Optional[Path] = None) -> Config:
+    """Load config from ~/.freckle.yaml or ~/.freckle.yml.
+
+    The parsed config is reused for as long as the file's content is
+    unchanged, so helpers that load it again within the same command
+    don't re-parse the YAML. Callers must treat it as read-only.
+
+    Args:
+        path: Config file to load instead of the one in the home dir
+    """
+    global _config_cache
+
+    path = path or get_config_path()
+    try:
+        digest = hashlib.blake2b(path.read_bytes(), digest_size=16).digest()
+    except OSError:
+        digest = b""
+
+    if _config_cache is not None and _config_cache[:2] == (path, digest):
+        return _config_cache[2]
+
+    config = Config(path, env=env)
+    _config_cache = (path, digest, config)
+    return config
+
+
+# Last manager built, keyed on its config, repo and the repo's HEAD file
+_manager_cache: Optional[
+    Tuple[Config, Path, Optional[bytes], DotfilesManager]
+] = None
 
 
 def get_dotfiles_manager(config: Config) -> Optional[DotfilesManager]:
-    """Create a DotfilesManager from config."""
+    """Create a DotfilesManager from config.
+
+    The manager is reused while the config object and the repo's HEAD
+    are unchanged, so repeated lookups within one command don't spawn
+    git again to find the current branch.
+    """
+    global _manager_cache
+
     repo_url = config.get("dotfiles.repo_url")
     if not repo_url:
         return None
 
-    dotfiles_dir = Path(config.get("dotfiles.dir")).expanduser()
-    if not dotfiles_dir.is_absolute():
-        dotfiles_dir = env.home / dotfiles_dir
-
-    # Try to get actual git branch, fall back to configured default
+    dotfiles_dir = get_dotfiles_dir(config)
+    try:
+        head = (dotfiles_dir / "HEAD").read_bytes()
+    except OSError:
+        head = None
+
+    if (
+        _manager_cache is not None
+        and _manager_cache[0] is config
+        and _manager_cache[1:3] == (dotfiles_dir, head)
+    ):
+        return _manager_cache[3]
+
+    # Try to get actual git branch, fall back to configured default.
+    # HEAD normally names the branch directly, so git is only needed
+    # for the unusual cases (detached HEAD and the like)
     branch = config.get_default_branch()
-    if dotfiles_dir.exists():
+    if head is not None and head.startswith(b"ref: refs/heads/"):
+        branch = (
+            head[len(b"ref: refs/heads/"):].decode(errors="replace").strip()
+            or branch
+        )
+    elif dotfiles_dir.exists():
         try:
-            from ..dotfiles import BareGitRepo
             git = BareGitRepo(dotfiles_dir, env.home)
             result = git.run("rev-parse", "--abbrev-ref", "HEAD")
             actual_branch = result.stdout.strip()
@@ -68,17 +124,36 @@ def get_dotfiles_manager(config: Config) -> Optional[DotfilesManager]:
         except Exception:
             pass  # Fall back to configured branch
 
-    return DotfilesManager(repo_url, dotfiles_dir, env.home, branch)
+    dotfiles = DotfilesManager(repo_url, dotfiles_dir, env.home, branch)
+    _manager_cache = (config, dotfiles_dir, head, dotfiles)
+    return dotfiles
 
 
-def get_dotfiles_dir(config: Config) -> Path:
-    """Get the dotfiles directory path from config."""
-    dotfiles_dir = Path(config.get("dotfiles.dir")).expanduser()
+DEFAULT_DOTFILES_DIR: str = Config.DEFAULT_CONFIG["dotfiles"]["dir"]
+
+
+@functools.lru_cache(maxsize=8)
+def _resolve_dotfiles_dir(raw_dir: str, home: Path) -> Path:
+    """Expand a configured dotfiles dir into an absolute path.
+
+    Cached on the raw string and home so repeated lookups within one
+    invocation don't redo the expansion.
+    """
+    dotfiles_dir = Path(raw_dir).expanduser()
     if not dotfiles_dir.is_absolute():
-        dotfiles_dir = env.home / dotfiles_dir
+        dotfiles_dir = home / dotfiles_dir
     return dotfiles_dir
 
 
+def get_dotfiles_dir(config: Config) -> Path:
+    """Get the dotfiles directory path from config.
+
+    An unset or empty dir (e.g. ``dir:`` left blank) means the default.
+    """
+    raw_dir = config.get("dotfiles.dir") or DEFAULT_DOTFILES_DIR
+    return _resolve_dotfiles_dir(str(raw_dir), env.home)
+
+
 def get_subprocess_error(e: subprocess.CalledProcessError) -> str:
     """Extract error message from CalledProcessError.
 
@@ -169,27 +244,39 @@ def normalize_to_home_relative(
     Returns:
         Home-relative path string, or None if path is outside home directory.
     """
-    home_dir = home or env.home
-    path = Path(path_str).expanduser()
+    home_dir = str(home or env.home)
+    path = os.path.expanduser(path_str)
 
-    if not path.is_absolute():
+    if not os.path.isabs(path):
         if prefer_existing:
             # Try cwd first, then home
-            cwd_path = Path.cwd() / path
-            home_path = home_dir / path
-
-            if cwd_path.exists():
-                path = cwd_path.resolve()
-            elif home_path.exists():
-                path = home_path.resolve()
+            cwd_path = os.path.join(os.getcwd(), path)
+            if os.path.lexists(cwd_path):
+                path = cwd_path
             else:
-                # Default to home if neither exists
-                path = home_path.resolve()
+                # Default to home whether or not it exists there
+                path = os.path.join(home_dir, path)
         else:
             # Always resolve from cwd
-            path = (Path.cwd() / path).resolve()
-
-    try:
-        return str(path.relative_to(home_dir))
-    except ValueError:
+            path = os.path.join(os.getcwd(), path)
+
+    # Work on the path as given, without resolving symlinks component by
+    # component; only a path that lands outside home is checked against
+    # the real locations (e.g. when home itself is reached via a symlink)
+    relative = _relative_to(os.path.normpath(path), home_dir)
+    if relative is None:
+        relative = _relative_to(
+            os.path.realpath(path), os.path.realpath(home_dir)
+        )
+    return relative
+
+
+def _relative_to(path: str, base: str) -> Optional[str]:
+    """Get path relative to base, or None if it is outside base."""
+    base = os.path.normpath(base)
+    if path == base:
+        return "."
+    prefix = base if base.endswith(os.sep) else base + os.sep
+    if not path.startswith(prefix):
         return None
+    return path[len(prefix):]
@@ -8,6 +8,7 @@ from typing import List, Optional
 import typer
 
 from ..dotfiles import GitHistoryService
+from ..dotfiles.history import COMMIT_LOG_FORMAT
 from .helpers import (
     env,
     get_config,
@@ -16,6 +17,18 @@ from .helpers import (
 )
 from .output import console, diff_add, diff_remove, error, info, muted, plain
 
+ONELINE_LOG_FORMAT = "--format=%h %s"
+
+# Columns available to 'history --fields' and their git log placeholders
+LOG_FIELDS = {
+    "hash": "%h",
+    "fullhash": "%H",
+    "date": "%aI",
+    "reldate": "%ar",
+    "author": "%an",
+    "subject": "%s",
+}
+
 
 def get_history_service(dotfiles_dir: Path) -> GitHistoryService:
     """Create a GitHistoryService for the dotfiles repo."""
@@ -50,6 +63,14 @@ def history(
         "--oneline",
         help="Compact one-line format (for general history)",
     ),
+    fields: Optional[str] = typer.Option(
+        None,
+        "--fields",
+        help=(
+            "Print only these comma-separated columns, tab-separated, "
+            f"for scripts ({', '.join(LOG_FIELDS)})"
+        ),
+    ),
 ):
     """Show git commit history for your dotfiles.
 
@@ -63,6 +84,7 @@ def history(
         freckle history ~/.zshrc          # History for zshrc
         freckle history tmux -n 5         # Last 5 commits for tmux
         freckle history nvim --files      # Show files changed per commit
+        freckle history --fields hash     # Just the hashes, for scripts
     """
     config = get_config()
     dotfiles_dir = get_dotfiles_dir(config)
@@ -72,6 +94,18 @@ def history(
         muted("Run 'freckle init' first to set up your dotfiles.")
         raise typer.Exit(1)
 
+    if fields is not None:
+        file_paths = []
+        if tool_or_path is not None:
+            file_paths = resolve_to_repo_paths(
+                tool_or_path, config, dotfiles_dir
+            )
+            if not file_paths:
+                error(f"Could not find config files for: {tool_or_path}")
+                raise typer.Exit(1)
+        show_history_fields(dotfiles_dir, limit, fields, file_paths)
+        return
+
     # If no tool specified, show general commit history
     if tool_or_path is None:
         show_general_history(dotfiles_dir, limit, oneline)
@@ -108,22 +142,67 @@ def history(
         muted(f"\n[Showing {limit} commits. Use --limit to see more]")
 
 
+def show_history_fields(
+    dotfiles_dir: Path,
+    limit: int,
+    fields: str,
+    file_paths: List[str],
+) -> None:
+    """Print selected commit columns as plain tab-separated lines.
+
+    Only the requested placeholders are passed to git, and decorations
+    are turned off, so git does no more work than the caller needs.
+    """
+    names = [name.strip() for name in fields.split(",") if name.strip()]
+    unknown = [name for name in names if name not in LOG_FIELDS]
+    if not names or unknown:
+        error(f"Unknown field(s): {', '.join(unknown) or fields!r}")
+        muted(f"Available fields: {', '.join(LOG_FIELDS)}")
+        raise typer.Exit(1)
+
+    format_str = "%x09".join(LOG_FIELDS[name] for name in names)
+    cmd = [
+        "git",
+        "--git-dir",
+        str(dotfiles_dir),
+        "log",
+        "--no-decorate",
+        f"--format={format_str}",
+        f"-n{limit}",
+    ]
+    if file_paths:
+        cmd += ["--", *file_paths]
+
+    try:
+        result = subprocess.run(
+            cmd,
+            capture_output=True,
+            text=True,
+            timeout=30,
+        )
+    except subprocess.TimeoutExpired:
+        error("Timeout fetching history.")
+        raise typer.Exit(1)
+
+    if result.returncode != 0:
+        error(result.stderr.strip() or "Could not read history.")
+        raise typer.Exit(1)
+
+    if result.stdout:
+        typer.echo(result.stdout, nl=False)
+
+
 def show_general_history(
     dotfiles_dir: Path, limit: int, oneline: bool
 ) -> None:
     """Show general commit history for the dotfiles repo."""
     try:
-        if oneline:
-            format_str = "%h %s"
-        else:
-            format_str = "%h|%aI|%an|%s"
-
         cmd = [
             "git",
             "--git-dir",
             str(dotfiles_dir),
             "log",
-            f"--format={format_str}",
+            ONELINE_LOG_FORMAT if oneline else COMMIT_LOG_FORMAT,
             f"-n{limit}",
         ]
 
@@ -138,7 +217,9 @@ def show_general_history(
             plain("No commits yet.")
             return
 
-        if not result.stdout.strip():
+        # isspace() is False for "", and unlike strip() doesn't copy the
+        # whole log just to test for emptiness
+        if not result.stdout or result.stdout.isspace():
             plain("No commits yet.")
             return
 
@@ -146,7 +227,7 @@ def show_general_history(
 
         if oneline:
             # Simple oneline format
-            for line in result.stdout.strip().split("\n"):
+            for line in result.stdout.splitlines():
                 if line:
                     parts = line.split(" ", 1)
                     if len(parts) == 2:
@@ -157,7 +238,7 @@ def show_general_history(
                         plain(line)
         else:
             # Detailed format with relative dates
-            for line in result.stdout.strip().split("\n"):
+            for line in result.stdout.splitlines():
                 if not line:
                     continue
 
@@ -330,16 +411,12 @@ def get_file_history(
         List of commit dicts with hash, date, author, message, files
     """
     try:
-        # Build git log command
-        # Format: hash|date|author|subject
-        format_str = "%h|%aI|%an|%s"
-
         cmd = [
             "git",
             "--git-dir",
             str(dotfiles_dir),
             "log",
-            f"--format={format_str}",
+            COMMIT_LOG_FORMAT,
             f"-n{limit}",
             "--follow",  # Follow file renames
             "--",
@@ -7,6 +7,7 @@ from pathlib import Path
 import typer
 import yaml
 
+from ..config import load_yaml
 from ..dotfiles import DotfilesManager
 from ..utils import validate_git_url, verify_git_url_accessible
 from .helpers import CONFIG_PATH, env, logger
@@ -27,7 +28,7 @@ def _try_clone_from_existing_config() -> bool:
     """
     try:
         with open(CONFIG_PATH) as f:
-            config = yaml.safe_load(f)
+            config = load_yaml(f)
     except Exception:
         return False
 
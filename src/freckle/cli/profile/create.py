@@ -6,6 +6,7 @@ from typing import List, Optional
 import typer
 import yaml
 
+from ...config import load_yaml
 from ..helpers import (
     CONFIG_FILENAME,
     CONFIG_PATH,
@@ -27,7 +28,7 @@ def add_profile_to_config(
     """Add a new profile to the config file."""
     # Read current config
     with open(CONFIG_PATH, "r") as f:
-        data = yaml.safe_load(f) or {}
+        data = load_yaml(f) or {}
 
     # Ensure profiles section exists
     if "profiles" not in data:
@@ -5,6 +5,7 @@ import subprocess
 import typer
 import yaml
 
+from ...config import load_yaml
 from ..helpers import (
     CONFIG_FILENAME,
     CONFIG_PATH,
@@ -19,7 +20,7 @@ def remove_profile_from_config(name: str):
     """Remove a profile from the config file."""
     # Read current config
     with open(CONFIG_PATH, "r") as f:
-        data = yaml.safe_load(f) or {}
+        data = load_yaml(f) or {}
 
     # Remove profile if it exists
     if "profiles" in data and name in data["profiles"]:
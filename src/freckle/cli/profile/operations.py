@@ -199,17 +199,11 @@ def profile_switch(config, name, force):
 
     # Check for local changes (only tracked files, not untracked)
     try:
-        result = dotfiles._git.run("status", "--porcelain")
-        output = result.stdout.strip()
-        if output:
-            # Filter out untracked files (lines starting with ??)
-            tracked_changes = [
-                line for line in output.split("\n")
-                if line and not line.startswith("??")
-            ]
-            has_changes = bool(tracked_changes)
-        else:
-            has_changes = False
+        result = dotfiles._git.run(
+            "status", "--porcelain", "--untracked-files=no"
+        )
+        # Untracked files aren't listed, so any output is a change
+        has_changes = bool(result.stdout) and not result.stdout.isspace()
     except subprocess.CalledProcessError:
         has_changes = False
 
@@ -5,6 +5,7 @@ from typing import List, Optional
 
 import typer
 
+from ..dotfiles import CleanStamp
 from .helpers import (
     CONFIG_FILENAME,
     env,
@@ -152,6 +153,11 @@ def _commit_files_individually(
     return True
 
 
+def _record_clean_state(dotfiles, stamp: CleanStamp) -> None:
+    """Remember the work tree as clean so scheduled saves can skip git."""
+    stamp.record(dotfiles._git.get_index_files())
+
+
 def do_save(
     message: Optional[str] = None,
     quiet: bool = False,
@@ -163,6 +169,9 @@ def do_save(
 
     Saves changes locally first, then tries to sync to remote.
     Does not fail if remote sync fails (offline-friendly).
+
+    Scheduled saves return early, without running git, when the work
+    tree is unchanged since it was last seen clean.
     """
     config = get_config()
 
@@ -179,7 +188,17 @@ def do_save(
             error("Dotfiles repository not found. Run 'freckle init' first.")
         return False
 
-    report = dotfiles.get_detailed_status()
+    stamp = CleanStamp(dotfiles_dir, env.home)
+    known_clean = stamp.is_clean()
+    if scheduled and known_clean:
+        return True
+
+    # A clean stamp still needs the fetch (for unpushed commits), but
+    # not the work tree diff
+    report = dotfiles.get_detailed_status(known_clean=known_clean)
+
+    if not report["has_local_changes"] and not known_clean:
+        _record_clean_state(dotfiles, stamp)
 
     if not report["has_local_changes"] and not report.get("is_ahead", False):
         if not quiet:
@@ -255,6 +274,9 @@ def do_save(
     if config_changed:
         _sync_config_to_all_branches(dotfiles, quiet)
 
+    if report["has_local_changes"]:
+        _record_clean_state(dotfiles, stamp)
+
     return True
 
 
@@ -1,16 +1,25 @@
 """Status command for freckle CLI."""
 
+import json
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from typing import List, Optional
 
 import typer
 
-from ..tools_registry import ToolDefinition, get_tools_from_config
+from ..tools_registry import (
+    ToolDefinition,
+    VersionCache,
+    get_tools_from_config,
+)
 from .helpers import env, get_config, get_config_path, get_dotfiles_manager
-from .output import error, header, muted, plain, success, warning
+from .output import console, error, header, muted, plain, success, warning
 from .profile.helpers import get_current_branch
 
+# How old (in seconds) remote-tracking info may get before status kicks
+# off a background fetch. status never waits on the network itself.
+STATUS_FETCH_MAX_AGE = 300
+
 
 @dataclass
 class ToolStatus:
@@ -21,12 +30,15 @@ class ToolStatus:
     version: Optional[str] = None
 
 
-def check_tool_status(tool: ToolDefinition) -> ToolStatus:
+def check_tool_status(
+    tool: ToolDefinition, versions: Optional[VersionCache] = None
+) -> ToolStatus:
     """Check if a tool is installed and get its version (thread-safe)."""
     is_installed = tool.is_installed()
     version = None
     if is_installed:
-        version = tool.get_version() or "installed"
+        found = versions.get_version(tool) if versions else tool.get_version()
+        version = found or "installed"
         if len(version) > 40:
             version = version[:37] + "..."
     return ToolStatus(tool=tool, is_installed=is_installed, version=version)
@@ -38,10 +50,12 @@ def check_tools_parallel(tools: List[ToolDefinition]) -> List[ToolStatus]:
         return []
 
     # Use ThreadPoolExecutor for I/O-bound subprocess calls
+    versions = VersionCache()
     results = {}
     with ThreadPoolExecutor(max_workers=min(8, len(tools))) as executor:
         future_to_tool = {
-            executor.submit(check_tool_status, tool): tool for tool in tools
+            executor.submit(check_tool_status, tool, versions): tool
+            for tool in tools
         }
         for future in as_completed(future_to_tool):
             tool = future_to_tool[future]
@@ -52,6 +66,7 @@ def check_tools_parallel(tools: List[ToolDefinition]) -> List[ToolStatus]:
                 results[tool.name] = ToolStatus(
                     tool=tool, is_installed=False, version=None
                 )
+    versions.save()
 
     # Return in original order
     return [results[tool.name] for tool in tools]
@@ -76,10 +91,46 @@ def _format_file_status(file_status: str) -> str:
     return status_map.get(file_status, f"status: {file_status}")
 
 
-def status():
+def _print_status_json(config) -> None:
+    """Print a one-line JSON summary of the dotfiles repo state."""
+    data = {"configured": False}
+    dotfiles = None
+    if config.get("dotfiles.repo_url"):
+        dotfiles = get_dotfiles_manager(config)
+
+    if dotfiles:
+        report = dotfiles.get_detailed_status(
+            max_fetch_age=STATUS_FETCH_MAX_AGE
+        )
+        data = {
+            "configured": True,
+            "initialized": report["initialized"],
+            "branch": report.get("branch"),
+            "local_commit": report.get("local_commit"),
+            "remote_commit": report.get("remote_commit"),
+            "ahead": report.get("ahead_count", 0),
+            "behind": report.get("behind_count", 0),
+            "dirty": report.get("has_local_changes", False),
+            "changed_files": report.get("changed_files", []),
+        }
+
+    typer.echo(json.dumps(data))
+
+
+def status(
+    json_output: bool = typer.Option(
+        False,
+        "--json",
+        help="Print a machine-readable summary for scripts and prompts.",
+    ),
+):
     """Show current setup status and check for updates."""
     config = get_config()
 
+    if json_output:
+        _print_status_json(config)
+        return
+
     repo_url = config.get("dotfiles.repo_url")
 
     header("--- freckle Status ---")
@@ -116,7 +167,6 @@ def status():
         if dotfiles:
             file_status = dotfiles.get_file_sync_status(config_filename)
             status_str = _format_file_status(file_status)
-            from .output import console
             console.print(f"  {config_filename} : {status_str}")
         else:
             success(f"{config_filename} : exists (no dotfiles)", prefix="  ✓")
@@ -126,59 +176,62 @@ def status():
     # Collect all config files associated with tools
     tool_config_files = set()
 
-    if tools:
-        plain("\nConfigured Tools:")
-
-        # Check all tools in parallel for faster status
-        tool_statuses = check_tools_parallel(tools)
+    # Buffer the per-tool and per-file lines and write each section to the
+    # terminal in one go. These sections only print to stdout; anything
+    # that reports to stderr stays unbuffered to keep its ordering.
+    with console:
+        if tools:
+            plain("\nConfigured Tools:")
 
-        from .output import console
+            # Check all tools in parallel for faster status
+            tool_statuses = check_tools_parallel(tools)
 
-        for ts in tool_statuses:
-            if ts.is_installed:
-                plain(f"  {ts.tool.name}:")
-                console.print(f"    Status : [green]✓[/green] {ts.version}")
-            else:
-                console.print(
-                    f"  {ts.tool.name}: [red]✗[/red] not installed"
-                )
-                continue
+            for ts in tool_statuses:
+                if ts.is_installed:
+                    plain(f"  {ts.tool.name}:")
+                    console.print(
+                        f"    Status : [green]✓[/green] {ts.version}"
+                    )
+                else:
+                    console.print(
+                        f"  {ts.tool.name}: [red]✗[/red] not installed"
+                    )
+                    continue
 
-            if dotfiles and ts.tool.config_files:
-                for cfg in ts.tool.config_files:
-                    tool_config_files.add(cfg)
-                    file_status = dotfiles.get_file_sync_status(cfg)
-                    if file_status == "not-found":
-                        continue
+                if dotfiles and ts.tool.config_files:
+                    for cfg in ts.tool.config_files:
+                        tool_config_files.add(cfg)
+                        file_status = dotfiles.get_file_sync_status(cfg)
+                        if file_status == "not-found":
+                            continue
 
-                    status_str = _format_file_status(file_status)
-                    console.print(f"    Config : {status_str} ({cfg})")
+                        status_str = _format_file_status(file_status)
+                        console.print(f"    Config : {status_str} ({cfg})")
 
     # Show all other tracked files
-    if dotfiles:
-        all_tracked = dotfiles.get_tracked_files()
-        other_tracked = [
-            f
-            for f in all_tracked
-            if f not in (".freckle.yaml", ".freckle.yml")
-            and f not in tool_config_files
-        ]
-
-        if other_tracked:
-            plain("\nOther Tracked Files:")
-            from .output import console
-
-            for f in sorted(other_tracked):
-                file_status = dotfiles.get_file_sync_status(f)
-                status_map = {
-                    "up-to-date": "[green]✓[/green]",
-                    "modified": "[yellow]⚠[/yellow] modified",
-                    "behind": "[cyan]↓[/cyan] behind",
-                    "missing": "[red]✗[/red] missing",
-                    "error": "[yellow]?[/yellow]",
-                }
-                status_str = status_map.get(file_status, "?")
-                console.print(f"  {status_str} {f}")
+    with console:
+        if dotfiles:
+            all_tracked = dotfiles.get_tracked_files()
+            other_tracked = [
+                f
+                for f in all_tracked
+                if f not in (".freckle.yaml", ".freckle.yml")
+                and f not in tool_config_files
+            ]
+
+            if other_tracked:
+                plain("\nOther Tracked Files:")
+                for f in sorted(other_tracked):
+                    file_status = dotfiles.get_file_sync_status(f)
+                    status_map = {
+                        "up-to-date": "[green]✓[/green]",
+                        "modified": "[yellow]⚠[/yellow] modified",
+                        "behind": "[cyan]↓[/cyan] behind",
+                        "missing": "[red]✗[/red] missing",
+                        "error": "[yellow]?[/yellow]",
+                    }
+                    status_str = status_map.get(file_status, "?")
+                    console.print(f"  {status_str} {f}")
 
     # Global Dotfiles Status
     if not repo_url:
@@ -186,7 +239,9 @@ def status():
     elif dotfiles:
         plain(f"\nDotfiles ({repo_url}):")
         try:
-            report = dotfiles.get_detailed_status()
+            report = dotfiles.get_detailed_status(
+                max_fetch_age=STATUS_FETCH_MAX_AGE
+            )
             if not report["initialized"]:
                 plain("  Status: Not initialized")
             else:
@@ -220,8 +275,6 @@ def status():
 
                 plain(f"  Local Commit : {report['local_commit']}")
 
-                from .output import console
-
                 if report.get("remote_branch_missing"):
                     console.print(
                         f"  Remote Commit: [red]✗[/red] "
@@ -241,6 +294,11 @@ def status():
                         "  Remote Status: [yellow]⚠[/yellow] "
                         "Could not fetch (offline?)"
                     )
+                elif report.get("fetch_in_background"):
+                    console.print(
+                        "  Remote Status: [yellow]⚠[/yellow] "
+                        "refreshing in background"
+                    )
 
                 if report["has_local_changes"]:
                     console.print(
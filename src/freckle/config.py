@@ -9,6 +9,15 @@ import yaml
 if TYPE_CHECKING:
     from .system import Environment
 
+# libyaml's C parser is several times faster; fall back to the pure
+# Python one when PyYAML was built without it
+_SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def load_yaml(stream: Any) -> Any:
+    """Parse YAML like yaml.safe_load, using libyaml when available."""
+    return yaml.load(stream, Loader=_SafeLoader)
+
 
 class Config:
     """Configuration manager for freckle."""
@@ -35,7 +44,7 @@ class Config:
 
         if config_path and config_path.exists():
             with open(config_path, "r") as f:
-                user_config = yaml.safe_load(f)
+                user_config = load_yaml(f)
                 if user_config:
                     self._deep_update(self.data, user_config)
 
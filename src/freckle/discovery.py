@@ -5,12 +5,15 @@ Scans the system to discover installed programs from various sources
 the freckle.yaml configuration.
 """
 
+import heapq
 import logging
+import os
 import shutil
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List, Optional, Set
+from typing import Callable, Dict, List, Optional, Set, Tuple
 
 from .system import Environment
 
@@ -161,18 +164,30 @@ class SystemScanner:
                 k: v for k, v in scanners.items() if k not in gui_sources
             }
 
-        # Run scanners
-        for source, scanner in scanners.items():
-            try:
-                programs = scanner()
-                self._scan_results[source] = programs
-                results.extend(programs)
-            except Exception as e:
-                logger.warning(f"Failed to scan {source}: {e}")
-                self._scan_results[source] = []
+        # Each source shells out to its own package manager, so run them
+        # concurrently; results keep the scanners' order.
+        if not scanners:
+            return results
+        with ThreadPoolExecutor(max_workers=len(scanners)) as executor:
+            scanned = list(executor.map(self._run_scanner, scanners.items()))
+
+        for source, programs in zip(scanners, scanned):
+            self._scan_results[source] = programs
+            results.extend(programs)
 
         return results
 
+    def _run_scanner(
+        self, item: Tuple[str, Callable[[], List[DiscoveredProgram]]]
+    ) -> List[DiscoveredProgram]:
+        """Run one source's scanner, returning [] if it fails."""
+        source, scanner = item
+        try:
+            return scanner()
+        except Exception as e:
+            logger.warning(f"Failed to scan {source}: {e}")
+            return []
+
     def get_scan_stats(self) -> Dict[str, int]:
         """Get counts of programs found per source."""
         return {
@@ -382,16 +397,20 @@ class SystemScanner:
         programs = []
 
         go_bin = self.env.home / "go" / "bin"
-        if not go_bin.exists():
+        try:
+            entries = os.scandir(go_bin)
+        except OSError:
             return []
 
-        for binary in go_bin.iterdir():
-            if binary.is_file() and binary.stat().st_mode & 0o111:
-                programs.append(DiscoveredProgram(
-                    name=binary.name,
-                    source="go",
-                    path=str(binary),
-                ))
+        # DirEntry caches its stat, so each binary is only stat'ed once
+        with entries:
+            for entry in entries:
+                if entry.is_file() and entry.stat().st_mode & 0o111:
+                    programs.append(DiscoveredProgram(
+                        name=entry.name,
+                        source="go",
+                        path=entry.path,
+                    ))
 
         return programs
 
@@ -607,6 +626,21 @@ def filter_notable_tools(
     return filtered
 
 
+# Source priority for suggestions (higher = better)
+SOURCE_PRIORITY: Dict[str, int] = {
+    "brew": 10,
+    "brew_cask": 9,
+    "cargo": 8,
+    "uv_tool": 8,
+    "npm": 7,
+    "apt": 6,
+    "go": 5,
+    "snap": 4,
+    "flatpak": 3,
+    "application": 2,
+}
+
+
 def get_suggestions(
     untracked: List[DiscoveredProgram],
     max_suggestions: int = 10,
@@ -622,39 +656,22 @@ def get_suggestions(
     Returns:
         List of suggested programs to add to config
     """
-    # Filter to notable tools first
-    notable = [p for p in untracked if p.name in NOTABLE_TOOLS]
+    # Split notable tools from the rest in one pass
+    notable = []
+    rest = []
+    for prog in untracked:
+        (notable if prog.name in NOTABLE_TOOLS else rest).append(prog)
 
     # Then non-dependency, non-system packages
-    other = filter_notable_tools(
-        [p for p in untracked if p not in notable],
-        exclude_deps=True,
-        exclude_system=True,
-    )
-
-    # Source priority (higher = better)
-    source_priority = {
-        "brew": 10,
-        "brew_cask": 9,
-        "cargo": 8,
-        "uv_tool": 8,
-        "npm": 7,
-        "apt": 6,
-        "go": 5,
-        "snap": 4,
-        "flatpak": 3,
-        "application": 2,
-    }
+    other = filter_notable_tools(rest, exclude_deps=True, exclude_system=True)
 
     def sort_key(prog: DiscoveredProgram) -> tuple:
         is_notable = prog.name in NOTABLE_TOOLS
-        priority = source_priority.get(prog.source, 0)
+        priority = SOURCE_PRIORITY.get(prog.source, 0)
         return (-int(is_notable), -priority, prog.name)
 
-    combined = notable + other
-    combined.sort(key=sort_key)
-
-    return combined[:max_suggestions]
+    # Only the top few are kept, so avoid sorting the whole list
+    return heapq.nsmallest(max_suggestions, notable + other, key=sort_key)
 
 
 def generate_yaml_snippet(programs: List[DiscoveredProgram]) -> str:
@@ -4,6 +4,7 @@ from .branch import BranchResolver
 from .history import CommitInfo, GitHistoryService
 from .manager import DotfilesManager
 from .repo import BareGitRepo
+from .stamp import CleanStamp
 from .types import (
     AddFilesResult,
     BranchInfo,
@@ -16,6 +17,7 @@ __all__ = [
     "BareGitRepo",
     "BranchInfo",
     "BranchResolver",
+    "CleanStamp",
     "CommitInfo",
     "CommitPushResult",
     "DotfilesManager",
@@ -5,6 +5,9 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import List, Optional
 
+# git log --format for CommitInfo rows: hash|ISO date|author|subject
+COMMIT_LOG_FORMAT = "--format=%h|%aI|%an|%s"
+
 
 @dataclass
 class CommitInfo:
@@ -191,10 +194,9 @@ class GitHistoryService:
             List of CommitInfo objects
         """
         try:
-            format_str = "%h|%aI|%an|%s"
             result = self._run_git(
                 "log",
-                f"--format={format_str}",
+                COMMIT_LOG_FORMAT,
                 f"-n{limit}",
                 "--follow",
                 "--",
@@ -246,10 +248,9 @@ class GitHistoryService:
             List of CommitInfo objects
         """
         try:
-            format_str = "%h|%aI|%an|%s"
             result = self._run_git(
                 "log",
-                f"--format={format_str}",
+                COMMIT_LOG_FORMAT,
                 f"-n{limit}",
             )
 
@@ -2,6 +2,7 @@
 
 import logging
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import List, Optional
@@ -198,22 +199,51 @@ class DotfilesManager:
             except Exception as e:
                 logger.warning(f"Could not push to remote: {e}")
 
-    def get_detailed_status(self, offline: bool = False) -> SyncStatus:
-        """Get detailed sync status of the dotfiles repository."""
+    def get_detailed_status(
+        self,
+        offline: bool = False,
+        max_fetch_age: Optional[float] = None,
+        known_clean: bool = False,
+    ) -> SyncStatus:
+        """Get detailed sync status of the dotfiles repository.
+
+        Args:
+            offline: Skip fetching from the remote
+            max_fetch_age: If set, don't wait on the network. Once the last
+                fetch is older than this many seconds, a fetch is started
+                in the background and the report uses the remote state
+                from the previous fetch.
+            known_clean: The caller already knows the work tree matches
+                HEAD (e.g. from a CleanStamp), so skip diffing it.
+        """
         if not self.dotfiles_dir.exists():
             return {"initialized": False}
 
         fetch_failed = False
-        if not offline:
-            fetch_failed = not self._git.fetch()
+        fetch_in_background = False
+        if not offline and max_fetch_age is None:
+            # The fetch is network-bound and the local diff doesn't depend
+            # on it, so collect changed files while it runs
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                pending_fetch = executor.submit(self._git.fetch)
+                changed_files = (
+                    [] if known_clean else self._git.get_changed_files()
+                )
+                fetch_failed = not pending_fetch.result()
+        else:
+            if not offline:
+                fetch_age = self._git.get_fetch_age()
+                if fetch_age is None or fetch_age > max_fetch_age:
+                    fetch_in_background = self._git.fetch_in_background()
 
-        # Resolve branch
+            changed_files = (
+                [] if known_clean else self._git.get_changed_files()
+            )
+
+        # Resolve branch (needs the fetched remote branches)
         branch_info = self._resolve_branch()
         effective_branch = branch_info["effective"]
 
-        # Get changed files
-        changed_files = self._git.get_changed_files()
-
         # Get commit info
         local_commit = self._git.get_commit_info(
             f"refs/heads/{effective_branch}"
@@ -234,6 +264,7 @@ class DotfilesManager:
                 "local_commit": None,
                 "remote_commit": remote_commit,
                 "fetch_failed": fetch_failed,
+                "fetch_in_background": fetch_in_background,
             }
 
         if remote_commit is None:
@@ -249,6 +280,7 @@ class DotfilesManager:
                 "local_commit": local_commit,
                 "remote_commit": None,
                 "fetch_failed": fetch_failed,
+                "fetch_in_background": fetch_in_background,
             }
 
         # Get ahead/behind
@@ -270,6 +302,7 @@ class DotfilesManager:
             "local_commit": local_commit,
             "remote_commit": remote_commit,
             "fetch_failed": fetch_failed,
+            "fetch_in_background": fetch_in_background,
         }
 
     def get_file_sync_status(self, relative_path: str) -> str:
@@ -373,7 +406,14 @@ class DotfilesManager:
         branch_info = self._resolve_branch()
         return operations.push(self._git, branch_info["effective"])
 
-    def force_checkout(self):
-        """Discard local changes and update to match remote."""
+    def force_checkout(self, fetch: bool = True):
+        """Discard local changes and update to match remote.
+
+        Args:
+            fetch: Fetch first. Pass False right after get_detailed_status,
+                which has already fetched.
+        """
         branch_info = self._resolve_branch()
-        operations.force_checkout(self._git, branch_info["effective"])
+        operations.force_checkout(
+            self._git, branch_info["effective"], fetch=fetch
+        )
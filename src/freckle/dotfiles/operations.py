@@ -41,12 +41,26 @@ def add_files(
             error="Dotfiles repository not initialized",
         )
 
+    existing: List[str] = []
     for f in files:
-        file_path = work_tree / f
-        if not file_path.exists():
+        if (work_tree / f).exists():
+            existing.append(f)
+        else:
             skipped.append(f)
-            continue
 
+    # Stage everything with one git call. A failing path makes git add
+    # stage nothing, so then fall back to adding one file at a time to
+    # find out which ones failed.
+    if len(existing) > 1:
+        try:
+            add_result = git.run("add", *existing, check=False)
+            if add_result.returncode == 0:
+                added = existing
+                existing = []
+        except Exception as e:
+            logger.debug(f"Batch add failed, adding files one by one: {e}")
+
+    for f in existing:
         try:
             add_result = git.run("add", f, check=False)
             if add_result.returncode != 0:
@@ -199,15 +213,17 @@ def push(git: BareGitRepo, branch: str) -> CommitPushResult:
         return CommitPushResult(success=False, error=error)
 
 
-def force_checkout(git: BareGitRepo, branch: str):
+def force_checkout(git: BareGitRepo, branch: str, fetch: bool = True):
     """Discard local changes and update to match remote.
 
     Args:
         git: The bare git repo wrapper
         branch: The branch to reset to
+        fetch: Fetch first. Callers that have just fetched can skip it.
     """
-    logger.info("Fetching latest from remote...")
-    git.fetch()
+    if fetch:
+        logger.info("Fetching latest from remote...")
+        git.fetch()
 
     try:
         git.run("reset", "--hard", f"origin/{branch}")
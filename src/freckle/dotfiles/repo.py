@@ -1,13 +1,50 @@
 """Low-level git operations for bare repositories."""
 
+import functools
 import logging
+import shutil
 import subprocess
+import time
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple, Union
 
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=1)
+def _git_executable() -> str:
+    """Get the absolute path to git, falling back to a PATH lookup."""
+    return shutil.which("git") or "git"
+
+
+def _spawn_git(
+    args: List[str],
+    timeout: int,
+    check: bool,
+    input: Union[str, bytes, None] = None,
+    text: bool = True,
+) -> subprocess.CompletedProcess:
+    """Run git with settings that let CPython use posix_spawn.
+
+    An absolute executable path, close_fds=False and no cwd/preexec_fn
+    allow subprocess to skip fork+exec where posix_spawn is available.
+    Python's own descriptors are non-inheritable, so close_fds=False
+    doesn't leak them.
+
+    With text=False, input is bytes and stdout/stderr are returned as
+    bytes, for output that has to be sliced by byte counts.
+    """
+    return subprocess.run(
+        [_git_executable()] + args,
+        capture_output=True,
+        text=text,
+        timeout=timeout,
+        check=check,
+        close_fds=False,
+        input=input,
+    )
+
+
 class BareGitRepo:
     """Low-level git operations for a bare repository with work tree.
 
@@ -38,20 +75,20 @@ class BareGitRepo:
         Returns:
             CompletedProcess with stdout/stderr captured as text
         """
-        cmd = [
-            "git",
-            "--git-dir",
-            str(self.git_dir),
-            "--work-tree",
-            str(self.work_tree),
-        ] + list(args)
-        return subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
+        # -C instead of cwd= keeps relative paths resolving against the
+        # work tree without disqualifying posix_spawn
+        return _spawn_git(
+            [
+                "-C",
+                str(self.work_tree),
+                "--git-dir",
+                str(self.git_dir),
+                "--work-tree",
+                str(self.work_tree),
+            ]
+            + list(args),
             timeout=timeout,
             check=check,
-            cwd=str(self.work_tree),
         )
 
     def run_bare(
@@ -61,9 +98,10 @@ class BareGitRepo:
 
         Used for operations that don't need a work tree context.
         """
-        cmd = ["git", "--git-dir", str(self.git_dir)] + list(args)
-        return subprocess.run(
-            cmd, capture_output=True, text=True, timeout=timeout, check=check
+        return _spawn_git(
+            ["--git-dir", str(self.git_dir)] + list(args),
+            timeout=timeout,
+            check=check,
         )
 
     def clone_bare(self, repo_url: str, timeout: int = 120):
@@ -71,28 +109,24 @@ class BareGitRepo:
         logger.info(
             f"Cloning bare repo from {repo_url} to {self.git_dir}"
         )
-        subprocess.run(
-            ["git", "clone", "--bare", repo_url, str(self.git_dir)],
-            check=True,
-            capture_output=True,
-            text=True,
+        _spawn_git(
+            ["clone", "--bare", repo_url, str(self.git_dir)],
             timeout=timeout,
+            check=True,
         )
 
-    def init_bare(self, initial_branch: str = "main"):
+    def init_bare(self, initial_branch: str = "main", timeout: int = 60):
         """Initialize a new bare repository."""
         logger.info(f"Creating new bare repository at {self.git_dir}")
-        subprocess.run(
+        _spawn_git(
             [
-                "git",
                 "init",
                 "--bare",
                 f"--initial-branch={initial_branch}",
                 str(self.git_dir),
             ],
+            timeout=timeout,
             check=True,
-            capture_output=True,
-            text=True,
         )
 
     def ensure_fetch_refspec(self):
@@ -132,6 +166,45 @@ class BareGitRepo:
             logger.warning(f"Could not fetch from remote: {e}")
             return False
 
+    def fetch_in_background(self) -> bool:
+        """Start a detached fetch from origin that outlives this process.
+
+        The new session that detaches it rules out posix_spawn, so this
+        one is always a fork+exec.
+
+        Returns True if the fetch was started.
+        """
+        self.ensure_fetch_refspec()
+
+        try:
+            subprocess.Popen(
+                [
+                    _git_executable(),
+                    "--git-dir",
+                    str(self.git_dir),
+                    "fetch",
+                    "--quiet",
+                    "origin",
+                ],
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                close_fds=False,
+                start_new_session=True,
+            )
+            return True
+        except Exception as e:
+            logger.warning(f"Could not start background fetch: {e}")
+            return False
+
+    def get_fetch_age(self) -> Optional[float]:
+        """Get seconds since the last fetch, or None if never fetched."""
+        try:
+            fetched_at = (self.git_dir / "FETCH_HEAD").stat().st_mtime
+        except OSError:
+            return None
+        return max(0.0, time.time() - fetched_at)
+
     def get_available_branches(self) -> List[str]:
         """Get list of all available branch names (local and remote)."""
         branches = set()
@@ -262,6 +335,227 @@ class BareGitRepo:
             logger.warning(f"Could not get changed files: {e}")
             return []
 
+    def get_index_files(self) -> List[str]:
+        """Get list of files currently recorded in the index."""
+        try:
+            result = self.run("ls-files", "-z", check=False)
+            if result.returncode != 0:
+                return []
+            return [f for f in result.stdout.split("\0") if f]
+        except Exception as e:
+            logger.warning(f"Could not list index files: {e}")
+            return []
+
+    def get_branch_heads(self, remote: Optional[str] = None) -> Dict[str, str]:
+        """Map every branch name to its commit id.
+
+        Args:
+            remote: List this remote's tracking branches (e.g. "origin")
+                instead of the local ones. Names are given without the
+                remote prefix.
+        """
+        prefix = f"refs/remotes/{remote}/" if remote else "refs/heads/"
+        heads: Dict[str, str] = {}
+        try:
+            result = self.run_bare(
+                "for-each-ref",
+                "--format=%(refname) %(objectname)",
+                prefix,
+                check=False,
+            )
+            for line in result.stdout.splitlines():
+                parts = line.split()
+                if len(parts) == 2 and parts[0].startswith(prefix):
+                    name = parts[0][len(prefix):]
+                    if name != "HEAD":
+                        heads[name] = parts[1]
+        except Exception as e:
+            logger.debug(f"Could not get branch heads: {e}")
+        return heads
+
+    def commit_blob(
+        self, parent: str, path: str, blob_id: str, message: str
+    ) -> str:
+        """Create a commit that sets a top-level file to an existing blob.
+
+        Builds the new tree with ls-tree/mktree and commits it with
+        commit-tree, so neither the work tree nor the index is touched.
+        No ref is moved; the caller updates the branch.
+
+        Args:
+            parent: Commit id to build on
+            path: File name at the root of the tree
+            blob_id: Blob to store at path
+            message: Commit message
+
+        Returns:
+            The new commit id.
+
+        Raises:
+            ValueError: If path isn't at the root of the tree
+            subprocess.CalledProcessError: If a git command fails
+        """
+        if "/" in path:
+            raise ValueError(f"Not a top-level path: {path}")
+
+        listing = self.run_bare("ls-tree", "-z", parent).stdout
+        mode = "100644"
+        entries = []
+        for entry in listing.split("\0"):
+            if not entry:
+                continue
+            info, name = entry.split("\t", 1)
+            if name == path:
+                mode = info.split()[0]
+            else:
+                entries.append(entry)
+        entries.append(f"{mode} blob {blob_id}\t{path}")
+
+        tree = _spawn_git(
+            ["--git-dir", str(self.git_dir), "mktree", "-z"],
+            timeout=60,
+            check=True,
+            input="".join(f"{entry}\0" for entry in entries),
+        ).stdout.strip()
+
+        return self.run_bare(
+            "commit-tree", tree, "-p", parent, "-m", message
+        ).stdout.strip()
+
+    def update_branches(
+        self, updates: Dict[str, Tuple[str, Optional[str]]]
+    ) -> bool:
+        """Move several branches in one atomic update-ref transaction.
+
+        Args:
+            updates: Branch name -> (new commit, expected old commit). An
+                expected old commit of None creates the branch, which
+                must not exist yet (update-ref's zero old-oid check).
+
+        Returns:
+            True if every branch was updated; otherwise none were.
+        """
+        if not updates:
+            return True
+
+        commands = "".join(
+            f"create refs/heads/{branch} {new}\n"
+            if old is None
+            else f"update refs/heads/{branch} {new} {old}\n"
+            for branch, (new, old) in updates.items()
+        )
+        try:
+            result = _spawn_git(
+                ["--git-dir", str(self.git_dir), "update-ref", "--stdin"],
+                timeout=60,
+                check=False,
+                input=commands,
+            )
+        except Exception as e:
+            logger.warning(f"Could not update branches: {e}")
+            return False
+
+        if result.returncode != 0:
+            logger.warning(f"update-ref failed: {result.stderr.strip()}")
+            return False
+        return True
+
+    def get_blob_ids(
+        self, specs: List[str], timeout: int = 60
+    ) -> Dict[str, Optional[str]]:
+        """Resolve several blob specs to object ids with one git process.
+
+        Cheaper than read_blobs when only equality matters, since no
+        content crosses the pipe.
+
+        Args:
+            specs: Object names such as "main:.freckle.yaml"
+            timeout: Command timeout in seconds
+
+        Returns:
+            Dictionary mapping each spec to its blob id, or None if it
+            doesn't exist or isn't a blob. Every spec maps to None if git
+            itself fails.
+        """
+        ids: Dict[str, Optional[str]] = dict.fromkeys(specs)
+        if not specs:
+            return ids
+
+        try:
+            result = _spawn_git(
+                ["--git-dir", str(self.git_dir), "cat-file",
+                 "--batch-check=%(objectname) %(objecttype)"],
+                timeout=timeout,
+                check=True,
+                input="".join(f"{spec}\n" for spec in specs),
+            )
+        except Exception as e:
+            logger.warning(f"Could not resolve objects: {e}")
+            return ids
+
+        # One line per spec: "<oid> <type>", or "<spec> missing"
+        for spec, line in zip(specs, result.stdout.splitlines()):
+            parts = line.split()
+            if len(parts) == 2 and parts[1] == "blob":
+                ids[spec] = parts[0]
+
+        return ids
+
+    def read_blobs(
+        self, specs: List[str], timeout: int = 60
+    ) -> Dict[str, Optional[str]]:
+        """Read several blobs with a single git process.
+
+        Feeds every spec to one 'git cat-file --batch' instead of running
+        'git show' once per spec.
+
+        Args:
+            specs: Object names such as "main:.freckle.yaml"
+            timeout: Command timeout in seconds
+
+        Returns:
+            Dictionary mapping each spec to its decoded content, or None
+            if it doesn't exist or isn't a blob. Every spec maps to None
+            if git itself fails.
+        """
+        contents: Dict[str, Optional[str]] = dict.fromkeys(specs)
+        if not specs:
+            return contents
+
+        try:
+            result = _spawn_git(
+                ["--git-dir", str(self.git_dir), "cat-file", "--batch"],
+                timeout=timeout,
+                check=True,
+                input="".join(f"{spec}\n" for spec in specs).encode(),
+                text=False,
+            )
+        except Exception as e:
+            logger.warning(f"Could not read objects: {e}")
+            return contents
+
+        # Each object is a "<oid> <type> <size>" header line followed by
+        # <size> bytes and a newline; unknown names get a single
+        # "<name> missing" (or "ambiguous") line instead.
+        out = result.stdout
+        pos = 0
+        for spec in specs:
+            end = out.find(b"\n", pos)
+            if end < 0:
+                break
+            header = out[pos:end].split()
+            pos = end + 1
+            if len(header) != 3:
+                continue
+            size = int(header[2])
+            if header[1] == b"blob":
+                contents[spec] = out[pos:pos + size].decode(
+                    "utf-8", errors="replace"
+                )
+            pos += size + 1
+
+        return contents
+
     def setup_branch(self, branch: str):
         """Set up the local branch to track remote after cloning."""
         try:
@@ -0,0 +1,150 @@
+"""Cheap clean-state detection for the dotfiles work tree.
+
+Remembers the index, HEAD and tracked-file stat info from the last time
+the work tree was known to be clean, so that frequent scheduled saves can
+skip spawning git entirely when nothing has been touched since.
+"""
+
+import json
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from ..utils import get_cache_dir
+
+logger = logging.getLogger(__name__)
+
+# Files modified this close to the time a stamp is written can't be told
+# apart from the recorded state by mtime alone ("racy git"), so a stamp is
+# never written while any tracked file is that fresh.
+RACY_WINDOW_NS = 2_000_000_000
+
+
+class CleanStamp:
+    """Persisted snapshot of a dotfiles work tree known to be clean."""
+
+    def __init__(
+        self,
+        git_dir: Path,
+        work_tree: Path,
+        path: Optional[Path] = None,
+    ):
+        """Initialize the stamp.
+
+        Args:
+            git_dir: Path to the bare git repository
+            work_tree: Path to the work tree (e.g., home directory)
+            path: Where to persist the stamp. Defaults to
+                  ~/.cache/freckle/last_clean
+        """
+        self.git_dir = Path(git_dir)
+        self.work_tree = Path(work_tree)
+        self.path = path or get_cache_dir() / "last_clean"
+
+    def _head_ref(self) -> Optional[str]:
+        """Get the ref HEAD points at (or the detached commit)."""
+        try:
+            return (self.git_dir / "HEAD").read_text().strip()
+        except OSError:
+            return None
+
+    def _repo_state(self) -> Optional[Dict[str, Any]]:
+        """Stat the index and the current branch ref."""
+        head = self._head_ref()
+        if head is None:
+            return None
+
+        ref_path = self.git_dir / "HEAD"
+        if head.startswith("ref: "):
+            ref_path = self.git_dir / head[5:]
+            if not ref_path.exists():
+                ref_path = self.git_dir / "packed-refs"
+
+        try:
+            return {
+                "head": head,
+                "index_mtime_ns": (self.git_dir / "index").stat().st_mtime_ns,
+                "head_mtime_ns": ref_path.stat().st_mtime_ns,
+            }
+        except OSError:
+            return None
+
+    def _file_state(self, relative_path: str) -> Optional[List[int]]:
+        """Get [mtime_ns, size] for a tracked file, or None if missing."""
+        try:
+            st = os.stat(self.work_tree / relative_path)
+        except OSError:
+            return None
+        return [st.st_mtime_ns, st.st_size]
+
+    def is_clean(self) -> bool:
+        """Check whether the work tree is unchanged since the last stamp.
+
+        Returns:
+            True only if a stamp exists and the index, HEAD and every
+            tracked file still match it. Any doubt returns False.
+        """
+        try:
+            data = json.loads(self.path.read_text())
+        except (OSError, ValueError):
+            return False
+
+        if not isinstance(data, dict):
+            return False
+        if data.get("git_dir") != str(self.git_dir):
+            return False
+        if data.get("repo") != self._repo_state():
+            return False
+
+        files = data.get("files")
+        if not isinstance(files, dict):
+            return False
+
+        for relative_path, recorded in files.items():
+            if self._file_state(relative_path) != recorded:
+                return False
+
+        return True
+
+    def record(self, tracked_files: List[str]) -> bool:
+        """Remember the current state as clean.
+
+        Args:
+            tracked_files: Files in the index, relative to the work tree
+
+        Returns:
+            True if the stamp was written.
+        """
+        repo = self._repo_state()
+        if repo is None:
+            self.clear()
+            return False
+
+        racy_after = time.time_ns() - RACY_WINDOW_NS
+        files: Dict[str, List[int]] = {}
+        for relative_path in tracked_files:
+            state = self._file_state(relative_path)
+            if state is None or state[0] >= racy_after:
+                self.clear()
+                return False
+            files[relative_path] = state
+
+        data = {"git_dir": str(self.git_dir), "repo": repo, "files": files}
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_name(self.path.name + ".tmp")
+            tmp_path.write_text(json.dumps(data))
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.debug(f"Could not write clean stamp: {e}")
+            return False
+        return True
+
+    def clear(self) -> None:
+        """Forget any recorded clean state."""
+        try:
+            self.path.unlink()
+        except OSError:
+            pass
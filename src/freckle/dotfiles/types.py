@@ -29,6 +29,7 @@ class SyncStatus(TypedDict):
     local_commit: NotRequired[Optional[str]]
     remote_commit: NotRequired[Optional[str]]
     fetch_failed: NotRequired[bool]
+    fetch_in_background: NotRequired[bool]
     remote_branch_missing: NotRequired[bool]
 
 
@@ -4,7 +4,9 @@ Prevents accidentally committing secrets like SSH keys, API tokens, and
 credentials to the dotfiles repository.
 """
 
+import os
 import re
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional
@@ -65,6 +67,9 @@ SECRET_CONTENT_PATTERNS: list[tuple[str, str]] = [
     (r"sk-proj-[a-zA-Z0-9-_]{100,}", "OpenAI project key"),
 ]
 
+# Below this many files, a worker pool costs more than it saves
+PARALLEL_SCAN_THRESHOLD = 4
+
 # Default allowed files (match patterns but are safe)
 DEFAULT_ALLOWED: list[str] = [
     ".ssh/config",
@@ -73,6 +78,18 @@ DEFAULT_ALLOWED: list[str] = [
 ]
 
 
+def _scope_inline_flags(pattern: str) -> str:
+    """Turn a leading global flag group like ``(?i)`` into a scoped one.
+
+    Global flags must start the whole expression, so they have to be
+    scoped before the pattern can be joined into a larger alternation.
+    """
+    match = re.match(r"\(\?([aiLmsux]+)\)", pattern)
+    if match:
+        return f"(?{match.group(1)}:{pattern[match.end():]})"
+    return f"(?:{pattern})"
+
+
 class SecretScanner:
     """Scans files for potential secrets."""
 
@@ -98,6 +115,13 @@ class SecretScanner:
         self.content_patterns = [
             (re.compile(p), desc) for p, desc in SECRET_CONTENT_PATTERNS
         ]
+        # All content patterns in one alternation, so clean files (the
+        # common case) are rejected in a single pass over their content
+        self._content_prefilter = re.compile(
+            "|".join(
+                _scope_inline_flags(p) for p, _ in SECRET_CONTENT_PATTERNS
+            )
+        )
 
         self.allowed = set(DEFAULT_ALLOWED)
         if extra_allow:
@@ -145,6 +169,9 @@ class SecretScanner:
         if self.is_allowed(filepath):
             return None
 
+        if not self._content_prefilter.search(content):
+            return None
+
         for pattern, description in self.content_patterns:
             match = pattern.search(content)
             if match:
@@ -197,6 +224,9 @@ class SecretScanner:
     ) -> list[SecretMatch]:
         """Scan multiple files for secrets.
 
+        Files are independent, so larger batches are scanned concurrently
+        to overlap file reads. Results keep the order of ``filepaths``.
+
         Args:
             filepaths: Paths relative to home directory
             home: Home directory path (for reading file content)
@@ -204,12 +234,15 @@ class SecretScanner:
         Returns:
             List of SecretMatch objects for files with detected secrets
         """
-        matches = []
-        for filepath in filepaths:
-            match = self.scan_file(filepath, home)
-            if match:
-                matches.append(match)
-        return matches
+        if len(filepaths) < PARALLEL_SCAN_THRESHOLD:
+            results = [self.scan_file(f, home) for f in filepaths]
+        else:
+            workers = min(8, os.cpu_count() or 1, len(filepaths))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                results = list(
+                    executor.map(lambda f: self.scan_file(f, home), filepaths)
+                )
+        return [match for match in results if match]
 
     def _redact_snippet(self, text: str, max_len: int = 40) -> str:
         """Redact a snippet to avoid exposing the actual secret."""
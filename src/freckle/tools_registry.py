@@ -7,12 +7,16 @@ This module provides:
 - Tool installation and verification
 """
 
+import json
 import logging
 import os
 import shutil
 import subprocess
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from .utils import get_cache_dir
 
 logger = logging.getLogger(__name__)
 
@@ -199,6 +203,117 @@ class ToolDefinition:
         return None
 
 
+# Version managers that put one dispatcher on PATH for every version
+# (mise/asdf/pyenv shims, volta's symlinks, rustup's hardlinked proxies
+# such as cargo and rustc). Which version a shim runs changes with
+# 'mise use', 'rustup default' and the like while the shim itself
+# doesn't, so their output can't be cached by stat.
+SHIM_DIR_NAMES = frozenset({"shims"})
+SHIM_DISPATCHERS = frozenset(
+    {"mise", "rtx", "asdf", "volta-shim", "rustup", "rustup-init"}
+)
+
+
+def _is_shim(executable: str, real_path: str) -> bool:
+    """Check whether a PATH entry is a version manager's shim."""
+    return (
+        os.path.basename(os.path.dirname(executable)) in SHIM_DIR_NAMES
+        or os.path.basename(os.path.dirname(real_path)) in SHIM_DIR_NAMES
+        or os.path.basename(real_path) in SHIM_DISPATCHERS
+    )
+
+
+class VersionCache:
+    """Remembered tool versions, keyed by the binary's path and stat.
+
+    Running '<tool> --version' costs a process per tool on every status
+    or doctor run; the answer only changes when the binary does. Shims
+    are always probed, since the binary behind them can change without
+    the shim changing.
+    """
+
+    def __init__(self, path: Optional[Path] = None):
+        """Initialize the cache.
+
+        Args:
+            path: Where to persist versions. Defaults to
+                  ~/.cache/freckle/tool_versions.json
+        """
+        self.path = path or get_cache_dir() / "tool_versions.json"
+        try:
+            entries = json.loads(self.path.read_text())
+        except (OSError, ValueError):
+            entries = None
+        self._entries: Dict[str, Any] = (
+            entries if isinstance(entries, dict) else {}
+        )
+        self._dirty = False
+        self._dispatcher_inodes: Optional[Set[Tuple[int, int]]] = None
+
+    def _is_dispatcher_link(self, st: os.stat_result) -> bool:
+        """Check whether a file is a hardlink to a dispatcher on PATH.
+
+        rustup's proxies are hardlinks, so neither their path nor their
+        real path names rustup; only the inode gives them away.
+        """
+        if st.st_nlink < 2:
+            return False
+        if self._dispatcher_inodes is None:
+            inodes = set()
+            for name in SHIM_DISPATCHERS:
+                dispatcher = shutil.which(name)
+                if dispatcher is None:
+                    continue
+                try:
+                    dst = os.stat(dispatcher)
+                except OSError:
+                    continue
+                inodes.add((dst.st_dev, dst.st_ino))
+            self._dispatcher_inodes = inodes
+        return (st.st_dev, st.st_ino) in self._dispatcher_inodes
+
+    def get_version(self, tool: ToolDefinition) -> Optional[str]:
+        """Get a tool's version, running it only if its binary changed."""
+        executable = shutil.which(tool.name)
+        if executable is None:
+            return tool.get_version()
+
+        # Key on the binary a symlink points to, so that switching it to
+        # another install (e.g. a Homebrew upgrade) is noticed
+        real_path = os.path.realpath(executable)
+        if _is_shim(executable, real_path):
+            return tool.get_version()
+        try:
+            st = os.stat(real_path)
+        except OSError:
+            return tool.get_version()
+        if self._is_dispatcher_link(st):
+            return tool.get_version()
+
+        key = [st.st_mtime_ns, st.st_size]
+        entry = self._entries.get(real_path)
+        if isinstance(entry, dict) and entry.get("stat") == key:
+            return entry.get("version")
+
+        version = tool.get_version()
+        self._entries[real_path] = {"stat": key, "version": version}
+        self._dirty = True
+        return version
+
+    def save(self) -> None:
+        """Persist any newly probed versions."""
+        if not self._dirty:
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_name(self.path.name + ".tmp")
+            tmp_path.write_text(json.dumps(self._entries))
+            os.replace(tmp_path, self.path)
+            self._dirty = False
+        except OSError as e:
+            logger.debug(f"Could not write version cache: {e}")
+
+
 class ToolsRegistry:
     """Registry and installer for configured tools."""
 
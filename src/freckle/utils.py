@@ -2,9 +2,11 @@
 
 import importlib.metadata
 import logging
+import os
 import re
 import subprocess
 import sys
+from pathlib import Path
 from typing import Tuple
 
 
@@ -34,6 +36,15 @@ def get_version() -> str:
         return "(development)"
 
 
+def get_cache_dir() -> Path:
+    """Get the directory for freckle's disposable cache files.
+
+    Honours $XDG_CACHE_HOME, falling back to ~/.cache/freckle.
+    """
+    base = os.environ.get("XDG_CACHE_HOME") or str(Path.home() / ".cache")
+    return Path(base) / "freckle"
+
+
 def validate_git_url(url: str) -> bool:
     """Validate that a URL looks like a valid git repository URL.
 
@@ -0,0 +1,33 @@
+"""Tests for lazy command registration."""
+
+import importlib
+
+import typer
+
+from freckle import cli
+
+
+class TestLazyRegistration:
+    """Tests for COMMAND_MODULES and argv-based registration."""
+
+    def test_requested_command_skips_options(self):
+        """Leading options are not mistaken for the command."""
+        assert cli._requested_command(["-v", "save", "-m", "x"]) == "save"
+        assert cli._requested_command(["--help"]) is None
+        assert cli._requested_command([]) is None
+
+    def test_command_map_matches_registered_commands(self):
+        """Every command a module registers is mapped to that module."""
+        for name in dict.fromkeys(cli.COMMAND_MODULES.values()):
+            scratch = typer.Typer()
+            module = importlib.import_module(f"freckle.cli.{name}")
+            module.register(scratch)
+
+            commands = [
+                c.name or c.callback.__name__
+                for c in scratch.registered_commands
+            ] + [g.name for g in scratch.registered_groups]
+
+            assert commands
+            for command in commands:
+                assert cli.COMMAND_MODULES[command] == name
@@ -0,0 +1,88 @@
+"""Tests for the config propagate command."""
+
+import subprocess
+from unittest.mock import MagicMock
+
+import pytest
+
+from freckle.cli import config as config_cli
+from freckle.dotfiles import DotfilesManager
+
+
+def _git(*args, cwd=None):
+    """Run git and return its stripped stdout."""
+    return subprocess.run(
+        ["git", *args],
+        cwd=cwd,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout.strip()
+
+
+@pytest.fixture
+def clone_with_remote_only_branch(tmp_path, monkeypatch):
+    """A fresh bare clone where 'work' exists only as origin/work."""
+    for var in ("AUTHOR", "COMMITTER"):
+        monkeypatch.setenv(f"GIT_{var}_NAME", "Test")
+        monkeypatch.setenv(f"GIT_{var}_EMAIL", "test@example.com")
+
+    # Upstream has main and work, with different configs
+    upstream = tmp_path / "upstream"
+    upstream.mkdir()
+    _git("init", "-q", "--initial-branch=main", cwd=upstream)
+    (upstream / ".freckle.yaml").write_text("profiles: {main: {}}\n")
+    _git("add", ".freckle.yaml", cwd=upstream)
+    _git("commit", "-q", "-m", "init", cwd=upstream)
+    _git("checkout", "-q", "-b", "work", cwd=upstream)
+    (upstream / ".freckle.yaml").write_text("profiles: {work: {}}\n")
+    _git("commit", "-q", "-am", "work config", cwd=upstream)
+    _git("checkout", "-q", "main", cwd=upstream)
+
+    # Clone it the way init does: bare, with only main set up locally
+    home = tmp_path / "home"
+    home.mkdir()
+    git_dir = home / ".dotfiles"
+    dotfiles = DotfilesManager(str(upstream), git_dir, home, "main")
+    dotfiles._git.clone_bare(str(upstream))
+    dotfiles._git.run_bare("branch", "-D", "work")
+    dotfiles._git.setup_branch("main")
+    (home / ".freckle.yaml").write_text("profiles: {main: {}}\n")
+
+    config = MagicMock()
+    config.get_profiles.return_value = {"main": {}, "work": {}}
+    monkeypatch.setattr(config_cli, "get_config", lambda: config)
+    monkeypatch.setattr(
+        config_cli,
+        "require_dotfiles_ready",
+        lambda _config: (dotfiles, git_dir),
+    )
+    return dotfiles, git_dir
+
+
+class TestConfigPropagate:
+    """Tests for config_propagate."""
+
+    def test_remote_only_branch_is_created_from_origin(
+        self, clone_with_remote_only_branch
+    ):
+        """A profile branch only on origin gets a local tracking branch."""
+        dotfiles, git_dir = clone_with_remote_only_branch
+        origin_work = _git(
+            "--git-dir", str(git_dir), "rev-parse", "refs/remotes/origin/work"
+        )
+        assert "work" not in dotfiles._git.get_branch_heads()
+
+        config_cli.config_propagate(force=True, dry_run=False)
+
+        heads = dotfiles._git.get_branch_heads()
+        assert _git(
+            "--git-dir", str(git_dir), "rev-parse", f"{heads['work']}^"
+        ) == origin_work
+        assert _git(
+            "--git-dir", str(git_dir), "show", "work:.freckle.yaml"
+        ) == "profiles: {main: {}}"
+        assert _git(
+            "--git-dir", str(git_dir), "rev-parse", "--abbrev-ref",
+            "work@{upstream}",
+        ) == "origin/work"
@@ -328,6 +328,41 @@ class TestSystemScanner:
         stats = scanner.get_scan_stats()
         assert stats == {}
 
+    def test_scan_all_keeps_source_order(self, mocker):
+        """Concurrent scans are merged in source order with stats."""
+        env = mocker.Mock(spec=Environment)
+        env.is_macos.return_value = False
+        env.is_linux.return_value = True
+        scanner = SystemScanner(env=env)
+        mocker.patch.object(
+            scanner,
+            "_scan_apt",
+            return_value=[DiscoveredProgram(name="git", source="apt")],
+        )
+        mocker.patch.object(
+            scanner,
+            "_scan_cargo",
+            return_value=[DiscoveredProgram(name="rg", source="cargo")],
+        )
+
+        programs = scanner.scan_all(sources=["cargo", "apt"])
+
+        assert [p.name for p in programs] == ["git", "rg"]
+        assert scanner.get_scan_stats() == {"apt": 1, "cargo": 1}
+
+    def test_scan_all_failed_source_is_empty(self, mocker):
+        """A scanner that raises contributes no programs."""
+        env = mocker.Mock(spec=Environment)
+        env.is_macos.return_value = False
+        env.is_linux.return_value = True
+        scanner = SystemScanner(env=env)
+        mocker.patch.object(
+            scanner, "_scan_apt", side_effect=RuntimeError("boom")
+        )
+
+        assert scanner.scan_all(sources=["apt"]) == []
+        assert scanner.get_scan_stats() == {"apt": 0}
+
 
 class TestNormalizeName:
     """Tests for the _normalize_name function."""
@@ -1,13 +1,22 @@
 """Tests for doctor command and its helper functions."""
 
+import json
+import time
 from unittest.mock import MagicMock
+from urllib.error import HTTPError
+
+import pytest
 
 from freckle.cli.doctor import (
     _check_config,
     _check_prerequisites,
     _diff_configs,
-    _get_config_from_branch,
+    _get_configs_from_branches,
     _get_latest_version,
+    _get_refs,
+    _get_remote_only_branches,
+    _get_remote_status,
+    _parse_branch_header,
     _print_suggestions,
 )
 
@@ -15,10 +24,19 @@ from freckle.cli.doctor import (
 class TestGetLatestVersion:
     """Tests for _get_latest_version function."""
 
+    @pytest.fixture(autouse=True)
+    def cache_dir(self, tmp_path, mocker):
+        """Keep the PyPI cache out of the real cache directory."""
+        mocker.patch(
+            "freckle.cli.doctor.get_cache_dir", return_value=tmp_path
+        )
+        return tmp_path
+
     def test_returns_version_on_success(self, mocker):
         """Returns version string from PyPI response."""
         mock_response = MagicMock()
         mock_response.read.return_value = b'{"info": {"version": "1.2.3"}}'
+        mock_response.headers = {"ETag": '"abc"'}
         mock_response.__enter__ = lambda s: s
         mock_response.__exit__ = MagicMock(return_value=False)
 
@@ -44,6 +62,7 @@ class TestGetLatestVersion:
         """Returns None when response is not valid JSON."""
         mock_response = MagicMock()
         mock_response.read.return_value = b"not valid json"
+        mock_response.headers = {}
         mock_response.__enter__ = lambda s: s
         mock_response.__exit__ = MagicMock(return_value=False)
 
@@ -55,6 +74,36 @@ class TestGetLatestVersion:
         result = _get_latest_version()
         assert result is None
 
+    def test_fresh_cache_skips_network(self, cache_dir, mocker):
+        """A recently cached version is returned without a request."""
+        (cache_dir / "pypi.json").write_text(
+            json.dumps({"version": "1.2.3", "fetched_at": time.time()})
+        )
+        urlopen = mocker.patch("freckle.cli.doctor.urllib.request.urlopen")
+
+        assert _get_latest_version() == "1.2.3"
+        urlopen.assert_not_called()
+
+    def test_stale_cache_revalidates_with_etag(self, cache_dir, mocker):
+        """A 304 for a stale cache returns the cached version."""
+        (cache_dir / "pypi.json").write_text(
+            json.dumps(
+                {"version": "1.2.3", "etag": '"abc"', "fetched_at": 0}
+            )
+        )
+        urlopen = mocker.patch(
+            "freckle.cli.doctor.urllib.request.urlopen",
+            side_effect=HTTPError(
+                "https://pypi.org", 304, "Not Modified", {}, None
+            ),
+        )
+
+        assert _get_latest_version() == "1.2.3"
+        request = urlopen.call_args[0][0]
+        assert request.get_header("If-none-match") == '"abc"'
+        cached = json.loads((cache_dir / "pypi.json").read_text())
+        assert cached["fetched_at"] > 0
+
 
 class TestCheckPrerequisites:
     """Tests for _check_prerequisites function."""
@@ -116,52 +165,143 @@ class TestCheckConfig:
         assert any("unknown_key" in w for w in warnings)
 
 
-class TestGetConfigFromBranch:
-    """Tests for _get_config_from_branch function."""
+class TestGetConfigsFromBranches:
+    """Tests for _get_configs_from_branches function."""
 
-    def test_returns_config_content_for_yaml(self):
-        """Returns config content when .freckle.yaml exists."""
+    def test_reads_all_branches_in_one_batch(self):
+        """Looks up both extensions for every branch in one call."""
         mock_dotfiles = MagicMock()
-        mock_result = MagicMock()
-        mock_result.stdout = "dotfiles:\n  repo_url: test"
-        mock_dotfiles._git.run.return_value = mock_result
+        mock_dotfiles._git.read_blobs.return_value = {
+            "main:.freckle.yaml": "dotfiles:\n  repo_url: test",
+            "main:.freckle.yml": None,
+            "linux:.freckle.yaml": None,
+            "linux:.freckle.yml": None,
+        }
+
+        configs = _get_configs_from_branches(mock_dotfiles, ["main", "linux"])
+
+        assert configs == {
+            "main": "dotfiles:\n  repo_url: test",
+            "linux": None,
+        }
+        mock_dotfiles._git.read_blobs.assert_called_once_with(
+            [
+                "main:.freckle.yaml",
+                "main:.freckle.yml",
+                "linux:.freckle.yaml",
+                "linux:.freckle.yml",
+            ]
+        )
 
-        content = _get_config_from_branch(mock_dotfiles, "main")
+    def test_falls_back_to_yml_extension(self):
+        """Uses .yml when .yaml doesn't exist."""
+        mock_dotfiles = MagicMock()
+        mock_dotfiles._git.read_blobs.return_value = {
+            "main:.freckle.yaml": None,
+            "main:.freckle.yml": "dotfiles:\n  repo_url: test",
+        }
+
+        configs = _get_configs_from_branches(mock_dotfiles, ["main"])
+
+        assert configs["main"] == "dotfiles:\n  repo_url: test"
+
+    def test_prefers_yaml_extension(self):
+        """Uses .yaml when both extensions exist."""
+        mock_dotfiles = MagicMock()
+        mock_dotfiles._git.read_blobs.return_value = {
+            "main:.freckle.yaml": "yaml",
+            "main:.freckle.yml": "yml",
+        }
 
-        assert content == "dotfiles:\n  repo_url: test"
-        mock_dotfiles._git.run.assert_called_with(
-            "show", "main:.freckle.yaml"
+        configs = _get_configs_from_branches(mock_dotfiles, ["main"])
+
+        assert configs["main"] == "yaml"
+
+
+class TestGetRefs:
+    """Tests for _get_refs and the helpers that consume it."""
+
+    def test_parses_for_each_ref_output(self):
+        """Reads every branch tip from one for-each-ref call."""
+        mock_dotfiles = MagicMock()
+        mock_dotfiles._git.run.return_value.stdout = (
+            "refs/heads/main\tabc1234\t2 days ago\tAdd zshrc\n"
+            "refs/remotes/origin/main\tabc1234\t2 days ago\tAdd zshrc\n"
         )
 
-    def test_tries_yml_extension_on_yaml_failure(self):
-        """Falls back to .yml when .yaml doesn't exist."""
-        from subprocess import CalledProcessError
+        refs = _get_refs(mock_dotfiles)
 
+        assert set(refs) == {"refs/heads/main", "refs/remotes/origin/main"}
+        assert refs["refs/heads/main"].commit == "abc1234"
+        assert refs["refs/heads/main"].commit_msg == "Add zshrc"
+        assert mock_dotfiles._git.run.call_count == 1
+
+    def test_remote_only_branches(self):
+        """Lists origin branches without a local branch, skipping HEAD."""
         mock_dotfiles = MagicMock()
-        mock_result = MagicMock()
-        mock_result.stdout = "dotfiles:\n  repo_url: test"
+        mock_dotfiles._git.run.return_value.stdout = (
+            "refs/heads/main\tabc1234\t2 days ago\tinit\n"
+            "refs/remotes/origin/HEAD\tabc1234\t2 days ago\tinit\n"
+            "refs/remotes/origin/main\tabc1234\t2 days ago\tinit\n"
+            "refs/remotes/origin/work\tdef5678\t3 weeks ago\twip\n"
+        )
 
-        def side_effect(cmd, path):
-            if path == "main:.freckle.yaml":
-                raise CalledProcessError(1, "git")
-            return mock_result
+        remote_only = _get_remote_only_branches(_get_refs(mock_dotfiles))
 
-        mock_dotfiles._git.run.side_effect = side_effect
+        assert [(b.name, b.last_commit_time) for b in remote_only] == [
+            ("work", "3 weeks ago")
+        ]
 
-        content = _get_config_from_branch(mock_dotfiles, "main")
+    def test_remote_status_same_tip_skips_rev_list(self):
+        """Matching local and origin tips need no ahead/behind count."""
+        mock_dotfiles = MagicMock()
+        mock_dotfiles._git.run.return_value.stdout = (
+            "refs/heads/main\tabc1234\t2 days ago\tinit\n"
+            "refs/remotes/origin/main\tabc1234\t2 days ago\tinit\n"
+        )
+        refs = _get_refs(mock_dotfiles)
 
-        assert content == "dotfiles:\n  repo_url: test"
+        status = _get_remote_status(mock_dotfiles, "main", refs)
 
-    def test_returns_none_when_no_config(self):
-        """Returns None when neither config file exists."""
-        from subprocess import CalledProcessError
+        assert status.exists and status.commit == "abc1234"
+        assert (status.ahead, status.behind) == (0, 0)
+        assert mock_dotfiles._git.run.call_count == 1
 
+    def test_remote_status_counts_when_tips_differ(self):
+        """Different tips are counted with rev-list."""
         mock_dotfiles = MagicMock()
-        mock_dotfiles._git.run.side_effect = CalledProcessError(1, "git")
+        mock_dotfiles._git.run.return_value.stdout = (
+            "refs/heads/main\tabc1234\t2 days ago\tinit\n"
+            "refs/remotes/origin/main\tdef5678\t3 days ago\tinit\n"
+        )
+        refs = _get_refs(mock_dotfiles)
+        mock_dotfiles._git.run.return_value.stdout = "2\t1\n"
+
+        status = _get_remote_status(mock_dotfiles, "main", refs)
+
+        assert (status.ahead, status.behind) == (2, 1)
+        assert status.diverged
+
+
+class TestParseBranchHeader:
+    """Tests for _parse_branch_header function."""
+
+    def test_branch_with_upstream(self):
+        """Strips the upstream and ahead/behind info."""
+        line = "## main...origin/main [ahead 1]"
+        assert _parse_branch_header(line) == "main"
+
+    def test_branch_without_upstream(self):
+        """Returns a local-only branch name as is."""
+        assert _parse_branch_header("## linux") == "linux"
 
-        content = _get_config_from_branch(mock_dotfiles, "main")
+    def test_unborn_branch(self):
+        """Handles a branch with no commits yet."""
+        assert _parse_branch_header("## No commits yet on main") == "main"
 
-        assert content is None
+    def test_detached_head(self):
+        """Reports a detached HEAD like rev-parse --abbrev-ref does."""
+        assert _parse_branch_header("## HEAD (no branch)") == "HEAD"
 
 
 class TestDiffConfigs:
@@ -0,0 +1,65 @@
+"""Tests for the changes command."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from freckle.cli import git as git_cli
+
+
+@pytest.fixture
+def run_changes(tmp_path, monkeypatch):
+    """Run changes() with home at tmp_path and return git's diff args."""
+    (tmp_path / "home" / ".config").mkdir(parents=True)
+    # Resolved, since changes() compares real paths against home
+    home = (tmp_path / "home").resolve()
+    monkeypatch.setenv("HOME", str(home))
+    monkeypatch.setattr(git_cli.env, "home", home)
+
+    dotfiles = MagicMock()
+    dotfiles._git.run.return_value = MagicMock(stdout="")
+    monkeypatch.setattr(git_cli, "get_config", MagicMock())
+    monkeypatch.setattr(
+        git_cli,
+        "require_dotfiles_ready",
+        lambda _config: (dotfiles, home / ".dotfiles"),
+    )
+
+    def run(files, cwd=home):
+        monkeypatch.chdir(cwd)
+        git_cli.changes(files=files, staged=False)
+        return list(dotfiles._git.run.call_args[0][2:])
+
+    return run, home
+
+
+class TestChangesPaths:
+    """Tests for how changes() maps its file arguments."""
+
+    def test_home_itself_becomes_dot(self, run_changes):
+        """'~' and the absolute home path both mean the whole work tree."""
+        run, home = run_changes
+
+        assert run(["~", str(home)]) == [".", "."]
+
+    def test_absolute_path_under_home(self, run_changes):
+        """Absolute paths under home are made home-relative."""
+        run, home = run_changes
+
+        assert run([str(home / ".zshrc")]) == [".zshrc"]
+
+    def test_relative_path_from_subdirectory(self, run_changes):
+        """Relative paths are taken from the cwd, not from home."""
+        run, home = run_changes
+
+        assert run(["starship.toml"], cwd=home / ".config") == [
+            ".config/starship.toml"
+        ]
+
+    def test_path_outside_home_is_passed_through(self, run_changes, tmp_path):
+        """Paths outside home are left for git to report."""
+        run, _ = run_changes
+
+        assert run([str(tmp_path / "elsewhere")]) == [
+            str(tmp_path / "elsewhere")
+        ]
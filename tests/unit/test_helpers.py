@@ -0,0 +1,181 @@
+"""Tests for shared CLI helpers."""
+
+from pathlib import Path
+from unittest.mock import MagicMock
+
+from freckle.cli import helpers
+
+
+class TestGetConfig:
+    """Tests for get_config caching."""
+
+    def test_reuses_config_while_content_unchanged(self, tmp_path, mocker):
+        """Same content returns the already-parsed Config."""
+        path = tmp_path / ".freckle.yaml"
+        path.write_text("vars:\n  a: 1\n")
+        mocker.patch.object(helpers, "get_config_path", return_value=path)
+        mocker.patch.object(helpers, "_config_cache", None)
+
+        assert helpers.get_config() is helpers.get_config()
+
+    def test_reloads_when_content_changes(self, tmp_path, mocker):
+        """Edited content is parsed again."""
+        path = tmp_path / ".freckle.yaml"
+        path.write_text("vars:\n  a: 1\n")
+        mocker.patch.object(helpers, "get_config_path", return_value=path)
+        mocker.patch.object(helpers, "_config_cache", None)
+
+        first = helpers.get_config()
+        path.write_text("vars:\n  a: 2\n")
+        second = helpers.get_config()
+
+        assert second is not first
+        assert second.get("vars.a") == 2
+
+    def test_explicit_path_shares_cache(self, tmp_path, mocker):
+        """Loading an explicit path primes the default lookup."""
+        path = tmp_path / ".freckle.yaml"
+        path.write_text("vars:\n  a: 1\n")
+        mocker.patch.object(helpers, "get_config_path", return_value=path)
+        mocker.patch.object(helpers, "_config_cache", None)
+
+        assert helpers.get_config(path) is helpers.get_config()
+
+
+class TestGetDotfilesDir:
+    """Tests for get_dotfiles_dir."""
+
+    def test_relative_dir_is_under_home(self):
+        """A relative dir is taken relative to home."""
+        config = MagicMock()
+        config.get.return_value = "dots"
+
+        result = helpers.get_dotfiles_dir(config)
+
+        assert result == helpers.env.home / "dots"
+
+    def test_unset_dir_uses_default(self):
+        """A null dir falls back to ~/.dotfiles, not a path named None."""
+        config = MagicMock()
+        config.get.return_value = None
+
+        result = helpers.get_dotfiles_dir(config)
+
+        assert result == Path("~/.dotfiles").expanduser()
+
+
+class TestGetDotfilesManager:
+    """Tests for get_dotfiles_manager caching."""
+
+    def _config(self, tmp_path):
+        config = MagicMock()
+        config.get.side_effect = lambda key, default=None: {
+            "dotfiles.repo_url": "https://example.com/dotfiles.git",
+            "dotfiles.dir": str(tmp_path / "dotfiles"),
+        }.get(key, default)
+        config.get_default_branch.return_value = "main"
+        return config
+
+    def test_reuses_manager_while_head_unchanged(self, tmp_path, mocker):
+        """Same config and HEAD return the same manager."""
+        (tmp_path / "dotfiles").mkdir()
+        (tmp_path / "dotfiles" / "HEAD").write_text("ref: refs/heads/main\n")
+        mocker.patch.object(helpers, "_manager_cache", None)
+        config = self._config(tmp_path)
+
+        first = helpers.get_dotfiles_manager(config)
+
+        assert helpers.get_dotfiles_manager(config) is first
+
+    def test_rebuilds_after_branch_switch(self, tmp_path, mocker):
+        """A rewritten HEAD builds a new manager."""
+        head = tmp_path / "dotfiles" / "HEAD"
+        head.parent.mkdir()
+        head.write_text("ref: refs/heads/main\n")
+        mocker.patch.object(helpers, "_manager_cache", None)
+        config = self._config(tmp_path)
+
+        first = helpers.get_dotfiles_manager(config)
+        head.write_text("ref: refs/heads/linux\n")
+
+        assert helpers.get_dotfiles_manager(config) is not first
+
+    def test_branch_read_from_head_without_git(self, tmp_path, mocker):
+        """A symbolic HEAD gives the branch without spawning git."""
+        head = tmp_path / "dotfiles" / "HEAD"
+        head.parent.mkdir()
+        head.write_text("ref: refs/heads/linux\n")
+        mocker.patch.object(helpers, "_manager_cache", None)
+        run = mocker.patch("freckle.dotfiles.BareGitRepo.run")
+
+        dotfiles = helpers.get_dotfiles_manager(self._config(tmp_path))
+
+        assert dotfiles.branch == "linux"
+        run.assert_not_called()
+
+
+class TestNormalizeToHomeRelative:
+    """Tests for normalize_to_home_relative."""
+
+    def test_absolute_path_under_home(self, tmp_path):
+        """Absolute paths are made relative to home."""
+        path = str(tmp_path / ".config" / "nvim" / "init.lua")
+
+        result = helpers.normalize_to_home_relative(path, home=tmp_path)
+
+        assert result == ".config/nvim/init.lua"
+
+    def test_path_outside_home(self, tmp_path):
+        """Paths outside home give None, even with a shared prefix."""
+        home = tmp_path / "home"
+        home.mkdir()
+        outside = str(tmp_path / "home2" / ".zshrc")
+
+        assert helpers.normalize_to_home_relative(outside, home=home) is None
+
+    def test_relative_path_prefers_cwd(self, tmp_path, monkeypatch):
+        """Relative paths existing under cwd are taken from cwd."""
+        (tmp_path / ".config").mkdir()
+        (tmp_path / ".config" / "starship.toml").write_text("")
+        monkeypatch.chdir(tmp_path / ".config")
+
+        result = helpers.normalize_to_home_relative(
+            "starship.toml", home=tmp_path
+        )
+
+        assert result == ".config/starship.toml"
+
+    def test_relative_path_falls_back_to_home(self, tmp_path, monkeypatch):
+        """Relative paths missing under cwd are taken from home."""
+        cwd = tmp_path / "elsewhere"
+        cwd.mkdir()
+        monkeypatch.chdir(cwd)
+
+        result = helpers.normalize_to_home_relative(".zshrc", home=tmp_path)
+
+        assert result == ".zshrc"
+
+    def test_symlink_inside_home_is_kept(self, tmp_path):
+        """A symlinked file is tracked where it is, not at its target."""
+        (tmp_path / "src").mkdir()
+        (tmp_path / "src" / "zshrc").write_text("")
+        (tmp_path / ".zshrc").symlink_to(tmp_path / "src" / "zshrc")
+
+        result = helpers.normalize_to_home_relative(
+            str(tmp_path / ".zshrc"), home=tmp_path
+        )
+
+        assert result == ".zshrc"
+
+    def test_home_reached_through_symlink(self, tmp_path):
+        """Real paths under a symlinked home still count as under home."""
+        real_home = tmp_path / "real"
+        real_home.mkdir()
+        link_home = tmp_path / "link"
+        link_home.symlink_to(real_home)
+
+        result = helpers.normalize_to_home_relative(
+            str(real_home / ".zshrc"), home=link_home
+        )
+
+        assert result == ".zshrc"
@@ -4,6 +4,9 @@ from datetime import datetime, timezone
 from pathlib import Path
 from unittest.mock import MagicMock
 
+import pytest
+import typer
+
 from freckle.cli.history import (
     display_commit,
     format_relative_date,
@@ -381,3 +384,56 @@ class TestDisplayColoredDiff:
         assert "diff --git" not in captured.out
         assert "index " not in captured.out
         assert "added" in captured.out
+
+
+class TestShowHistoryFields:
+    """Tests for show_history_fields function."""
+
+    def test_requests_only_selected_fields(self, mocker, capsys):
+        """Builds a format from just the requested fields."""
+        from freckle.cli.history import show_history_fields
+
+        mock_run = mocker.patch("freckle.cli.history.subprocess.run")
+        mock_run.return_value = MagicMock(
+            returncode=0, stdout="abc1234\tInit\n"
+        )
+
+        show_history_fields(
+            Path("/test/.dotfiles"), 5, "hash,subject", [".zshrc"]
+        )
+
+        cmd = mock_run.call_args[0][0]
+        assert "--format=%h%x09%s" in cmd
+        assert "--no-decorate" in cmd
+        assert cmd[-2:] == ["--", ".zshrc"]
+        assert capsys.readouterr().out == "abc1234\tInit\n"
+
+    def test_unknown_field_exits(self, mocker):
+        """Rejects fields that aren't in LOG_FIELDS."""
+        from freckle.cli.history import show_history_fields
+
+        mock_run = mocker.patch("freckle.cli.history.subprocess.run")
+
+        with pytest.raises(typer.Exit):
+            show_history_fields(Path("/test/.dotfiles"), 5, "hash,bogus", [])
+
+        mock_run.assert_not_called()
+
+    def test_git_failure_exits_with_error(self, mocker, capsys):
+        """A failing git log is reported, not shown as empty history."""
+        from freckle.cli.history import show_history_fields
+
+        mocker.patch(
+            "freckle.cli.history.subprocess.run",
+            return_value=MagicMock(
+                returncode=128,
+                stdout="",
+                stderr="fatal: bad revision 'nope'\n",
+            ),
+        )
+
+        with pytest.raises(typer.Exit) as exc_info:
+            show_history_fields(Path("/test/.dotfiles"), 5, "hash", [])
+
+        assert exc_info.value.exit_code == 1
+        assert "bad revision" in capsys.readouterr().err
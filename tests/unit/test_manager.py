@@ -111,9 +111,13 @@ class TestGetDetailedStatus:
                             manager._git, "get_ahead_behind"
                         ) as m_ab:
                             m_ab.return_value = (0, 0)
-                            manager.get_detailed_status(offline=True)
+                            with patch(
+                                "freckle.dotfiles.manager.ThreadPoolExecutor"
+                            ) as mock_pool:
+                                manager.get_detailed_status(offline=True)
 
         mock_fetch.assert_not_called()
+        mock_pool.assert_not_called()
 
     def test_fetch_failure_is_recorded(self, tmp_path):
         """Records fetch failure in status."""
@@ -203,6 +207,90 @@ class TestGetDetailedStatus:
         assert status["remote_commit"] is None
         assert status.get("remote_branch_missing") is True
 
+    def test_known_clean_skips_diff(self, tmp_path):
+        """A caller-known clean work tree isn't diffed."""
+        dotfiles_dir = tmp_path / ".dotfiles"
+        dotfiles_dir.mkdir()
+
+        manager = DotfilesManager(
+            repo_url="https://github.com/user/dotfiles.git",
+            dotfiles_dir=dotfiles_dir,
+            work_tree=tmp_path,
+            branch="main"
+        )
+
+        with patch.object(manager._git, "fetch", return_value=True):
+            with patch.object(manager, "_resolve_branch") as mock_resolve:
+                mock_resolve.return_value = {
+                    "configured": "main",
+                    "effective": "main",
+                    "reason": "configured"
+                }
+                with patch.object(manager._git, "get_changed_files") as m_ch:
+                    with patch.object(manager._git, "get_commit_info") as m_ci:
+                        m_ci.return_value = "abc1234"
+                        with patch.object(
+                            manager._git, "get_ahead_behind"
+                        ) as m_ab:
+                            m_ab.return_value = (2, 0)
+                            status = manager.get_detailed_status(
+                                known_clean=True
+                            )
+
+        m_ch.assert_not_called()
+        assert status["has_local_changes"] is False
+        assert status["is_ahead"] is True
+
+    def _status_with_fetch_age(self, tmp_path, fetch_age):
+        """Run get_detailed_status with max_fetch_age and a given age."""
+        dotfiles_dir = tmp_path / ".dotfiles"
+        dotfiles_dir.mkdir()
+
+        manager = DotfilesManager(
+            repo_url="https://github.com/user/dotfiles.git",
+            dotfiles_dir=dotfiles_dir,
+            work_tree=tmp_path,
+            branch="main"
+        )
+        git = manager._git
+
+        with patch.object(git, "fetch") as mock_fetch, \
+                patch(
+                    "freckle.dotfiles.manager.ThreadPoolExecutor"
+                ) as mock_pool, \
+                patch.object(git, "fetch_in_background") as mock_bg, \
+                patch.object(git, "get_fetch_age", return_value=fetch_age), \
+                patch.object(manager, "_resolve_branch") as mock_resolve, \
+                patch.object(git, "get_changed_files", return_value=[]), \
+                patch.object(git, "get_commit_info", return_value="abc"), \
+                patch.object(git, "get_ahead_behind", return_value=(0, 0)):
+            mock_bg.return_value = True
+            mock_resolve.return_value = {
+                "configured": "main",
+                "effective": "main",
+                "reason": "configured"
+            }
+            status = manager.get_detailed_status(max_fetch_age=300)
+
+        mock_fetch.assert_not_called()
+        # No blocking fetch to overlap with, so no worker thread either
+        mock_pool.assert_not_called()
+        return status, mock_bg
+
+    def test_recent_fetch_is_reused(self, tmp_path):
+        """A fresh FETCH_HEAD means no fetch at all."""
+        status, mock_bg = self._status_with_fetch_age(tmp_path, 10.0)
+
+        mock_bg.assert_not_called()
+        assert status["fetch_in_background"] is False
+
+    def test_stale_fetch_refreshes_in_background(self, tmp_path):
+        """A stale or missing FETCH_HEAD starts a background fetch."""
+        status, mock_bg = self._status_with_fetch_age(tmp_path, None)
+
+        mock_bg.assert_called_once()
+        assert status["fetch_in_background"] is True
+
 
 class TestGetFileSyncStatus:
     """Tests for get_file_sync_status method."""
@@ -59,6 +59,44 @@ class TestAddFiles:
         assert ".zshrc" in result["added"]
         assert result["skipped"] == []
 
+    def test_multiple_files_added_in_one_call(self, tmp_path):
+        """Several files are staged with a single git add."""
+        git_dir = tmp_path / ".dotfiles"
+        git_dir.mkdir()
+        (tmp_path / ".zshrc").write_text("# zshrc")
+        (tmp_path / ".vimrc").write_text("set nu")
+
+        mock_git = MagicMock()
+        mock_git.git_dir = git_dir
+        mock_git.run.return_value = MagicMock(returncode=0)
+
+        result = add_files(mock_git, tmp_path, [".zshrc", ".vimrc"])
+
+        assert result["added"] == [".zshrc", ".vimrc"]
+        mock_git.run.assert_called_once_with(
+            "add", ".zshrc", ".vimrc", check=False
+        )
+
+    def test_batch_failure_falls_back_per_file(self, tmp_path):
+        """A failed batch add is retried file by file."""
+        git_dir = tmp_path / ".dotfiles"
+        git_dir.mkdir()
+        (tmp_path / ".zshrc").write_text("# zshrc")
+        (tmp_path / ".vimrc").write_text("set nu")
+
+        mock_git = MagicMock()
+        mock_git.git_dir = git_dir
+        mock_git.run.side_effect = [
+            MagicMock(returncode=1, stderr="ignored"),
+            MagicMock(returncode=0),
+            MagicMock(returncode=1, stderr="ignored"),
+        ]
+
+        result = add_files(mock_git, tmp_path, [".zshrc", ".vimrc"])
+
+        assert result["added"] == [".zshrc"]
+        assert result["skipped"] == [".vimrc"]
+
     def test_git_add_failure_skips_file(self, tmp_path):
         """Files that fail to add are skipped."""
         git_dir = tmp_path / ".dotfiles"
@@ -245,6 +283,18 @@ class TestForceCheckout:
             "reset", "--hard", "origin/main"
         )
 
+    def test_skips_fetch_when_asked(self):
+        """fetch=False resets to the already-fetched remote ref."""
+        mock_git = MagicMock()
+        mock_git.run.return_value = MagicMock(returncode=0)
+
+        force_checkout(mock_git, "main", fetch=False)
+
+        mock_git.fetch.assert_not_called()
+        mock_git.run.assert_called_once_with(
+            "reset", "--hard", "origin/main"
+        )
+
     def test_reset_failure_raises(self):
         """Reset failure raises RuntimeError."""
         mock_git = MagicMock()
@@ -449,3 +449,164 @@ class TestSetupBranch:
                 mock_bare.side_effect = Exception("Git error")
                 # Should not raise
                 repo.setup_branch("main")
+
+
+class TestReadBlobs:
+    """Tests for read_blobs method."""
+
+    def test_reads_blobs_and_missing_specs(self, tmp_path):
+        """Returns content for existing blobs and None otherwise."""
+        git_dir = tmp_path / ".dotfiles"
+        subprocess.run(
+            ["git", "init", "--bare", "-q", str(git_dir)], check=True
+        )
+        repo = BareGitRepo(git_dir, tmp_path)
+        oid = subprocess.run(
+            ["git", "--git-dir", str(git_dir), "hash-object", "-w", "--stdin"],
+            input="a: 1\nb: 2\n",
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+
+        result = repo.read_blobs([oid, "main:.freckle.yaml", oid])
+
+        assert result == {oid: "a: 1\nb: 2\n", "main:.freckle.yaml": None}
+
+    def test_returns_none_for_all_on_exception(self, tmp_path):
+        """Maps every spec to None when git can't be run."""
+        repo = BareGitRepo(tmp_path / ".dotfiles", tmp_path)
+
+        with patch("subprocess.run", side_effect=OSError("no git")):
+            result = repo.read_blobs(["main:a", "linux:a"])
+
+        assert result == {"main:a": None, "linux:a": None}
+
+
+class TestGetBlobIds:
+    """Tests for get_blob_ids method."""
+
+    def test_resolves_blobs_and_missing_specs(self, tmp_path):
+        """Returns blob ids for existing blobs and None otherwise."""
+        git_dir = tmp_path / ".dotfiles"
+        subprocess.run(
+            ["git", "init", "--bare", "-q", str(git_dir)], check=True
+        )
+        repo = BareGitRepo(git_dir, tmp_path)
+        oid = subprocess.run(
+            ["git", "--git-dir", str(git_dir), "hash-object", "-w", "--stdin"],
+            input="a: 1\n",
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+
+        result = repo.get_blob_ids(["main:.freckle.yaml", oid])
+
+        assert result == {"main:.freckle.yaml": None, oid: oid}
+
+
+class TestCommitBlob:
+    """Tests for commit_blob and get_branch_heads methods."""
+
+    def test_commits_file_without_checkout(self, tmp_path, monkeypatch):
+        """Replaces one root entry and keeps the rest of the tree."""
+        for var in ("AUTHOR", "COMMITTER"):
+            monkeypatch.setenv(f"GIT_{var}_NAME", "Test")
+            monkeypatch.setenv(f"GIT_{var}_EMAIL", "test@example.com")
+
+        git_dir = tmp_path / ".dotfiles"
+        home = tmp_path / "home"
+        home.mkdir()
+        subprocess.run(
+            ["git", "init", "--bare", "-q", "--initial-branch=main",
+             str(git_dir)],
+            check=True,
+        )
+        repo = BareGitRepo(git_dir, home)
+        (home / ".freckle.yaml").write_text("old\n")
+        (home / ".zshrc").write_text("zsh\n")
+        repo.run("add", ".freckle.yaml", ".zshrc")
+        repo.run("commit", "-q", "-m", "init")
+        blob = subprocess.run(
+            ["git", "--git-dir", str(git_dir), "hash-object", "-w", "--stdin"],
+            input="new\n",
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+
+        parent = repo.get_branch_heads()["main"]
+        commit = repo.commit_blob(parent, ".freckle.yaml", blob, "Sync")
+
+        assert repo.read_blobs([f"{commit}:.freckle.yaml"]) == {
+            f"{commit}:.freckle.yaml": "new\n"
+        }
+        assert repo.get_blob_ids([f"{commit}:.zshrc"])[f"{commit}:.zshrc"]
+        assert (home / ".freckle.yaml").read_text() == "old\n"
+        assert repo.get_branch_heads()["main"] == parent
+
+    def test_rejects_nested_path(self, tmp_path):
+        """Only files at the root of the tree are supported."""
+        repo = BareGitRepo(tmp_path / ".dotfiles", tmp_path)
+
+        with pytest.raises(ValueError):
+            repo.commit_blob("abc", ".config/x", "def", "msg")
+
+
+class TestUpdateBranches:
+    """Tests for update_branches method."""
+
+    def test_updates_are_all_or_nothing(self, tmp_path, monkeypatch):
+        """A stale expected value rejects the whole transaction."""
+        for var in ("AUTHOR", "COMMITTER"):
+            monkeypatch.setenv(f"GIT_{var}_NAME", "Test")
+            monkeypatch.setenv(f"GIT_{var}_EMAIL", "test@example.com")
+
+        git_dir = tmp_path / ".dotfiles"
+        subprocess.run(
+            ["git", "init", "--bare", "-q", str(git_dir)], check=True
+        )
+        repo = BareGitRepo(git_dir, tmp_path)
+        # git knows the empty tree without it being written
+        empty_tree = "4b825dc642cb6eb9a060e54bf8d69288fbee4904"
+        first = repo.run_bare("commit-tree", empty_tree, "-m", "a").stdout
+        second = repo.run_bare("commit-tree", empty_tree, "-m", "b").stdout
+        first, second = first.strip(), second.strip()
+        repo.run_bare("update-ref", "refs/heads/main", first)
+        repo.run_bare("update-ref", "refs/heads/linux", first)
+
+        assert repo.update_branches({
+            "main": (second, first),
+            "linux": (second, second),
+        }) is False
+        assert repo.get_branch_heads() == {"main": first, "linux": first}
+
+        assert repo.update_branches({
+            "main": (second, first),
+            "linux": (second, first),
+        }) is True
+        assert repo.get_branch_heads() == {"main": second, "linux": second}
+
+    def test_none_expected_creates_branch(self, tmp_path, monkeypatch):
+        """An expected old commit of None creates a missing branch only."""
+        for var in ("AUTHOR", "COMMITTER"):
+            monkeypatch.setenv(f"GIT_{var}_NAME", "Test")
+            monkeypatch.setenv(f"GIT_{var}_EMAIL", "test@example.com")
+
+        git_dir = tmp_path / ".dotfiles"
+        subprocess.run(
+            ["git", "init", "--bare", "-q", str(git_dir)], check=True
+        )
+        repo = BareGitRepo(git_dir, tmp_path)
+        empty_tree = "4b825dc642cb6eb9a060e54bf8d69288fbee4904"
+        first = repo.run_bare("commit-tree", empty_tree, "-m", "a").stdout
+        first = first.strip()
+        repo.run_bare("update-ref", "refs/remotes/origin/work", first)
+
+        assert repo.update_branches({"work": (first, None)}) is True
+        assert repo.get_branch_heads() == {"work": first}
+        assert repo.get_branch_heads(remote="origin") == {"work": first}
+
+        # Creating it again must fail, since it now exists
+        assert repo.update_branches({"work": (first, None)}) is False
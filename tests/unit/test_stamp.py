@@ -0,0 +1,101 @@
+"""Tests for clean-state stamp."""
+
+import os
+
+from freckle.dotfiles.stamp import CleanStamp
+
+
+def _make_repo(tmp_path):
+    """Create a minimal fake bare repo and work tree."""
+    git_dir = tmp_path / "dotfiles"
+    (git_dir / "refs" / "heads").mkdir(parents=True)
+    (git_dir / "HEAD").write_text("ref: refs/heads/main\n")
+    (git_dir / "refs" / "heads" / "main").write_text("abc123\n")
+    (git_dir / "index").write_bytes(b"index")
+
+    home = tmp_path / "home"
+    home.mkdir()
+    zshrc = home / ".zshrc"
+    zshrc.write_text("export FOO=1\n")
+    # Age the file so it's outside the racy window
+    os.utime(zshrc, ns=(1_000_000_000, 1_000_000_000))
+
+    return git_dir, home
+
+
+class TestCleanStamp:
+    """Tests for CleanStamp."""
+
+    def test_not_clean_without_stamp(self, tmp_path):
+        """No stamp file means not known to be clean."""
+        git_dir, home = _make_repo(tmp_path)
+        stamp = CleanStamp(git_dir, home, path=tmp_path / "stamp")
+
+        assert stamp.is_clean() is False
+
+    def test_clean_after_record(self, tmp_path):
+        """Recorded state is reported as clean when nothing changed."""
+        git_dir, home = _make_repo(tmp_path)
+        stamp = CleanStamp(git_dir, home, path=tmp_path / "stamp")
+
+        assert stamp.record([".zshrc"]) is True
+        assert stamp.is_clean() is True
+
+    def test_modified_file_is_not_clean(self, tmp_path):
+        """Editing a tracked file invalidates the stamp."""
+        git_dir, home = _make_repo(tmp_path)
+        stamp = CleanStamp(git_dir, home, path=tmp_path / "stamp")
+        stamp.record([".zshrc"])
+
+        (home / ".zshrc").write_text("export FOO=2\n")
+
+        assert stamp.is_clean() is False
+
+    def test_deleted_file_is_not_clean(self, tmp_path):
+        """Deleting a tracked file invalidates the stamp."""
+        git_dir, home = _make_repo(tmp_path)
+        stamp = CleanStamp(git_dir, home, path=tmp_path / "stamp")
+        stamp.record([".zshrc"])
+
+        (home / ".zshrc").unlink()
+
+        assert stamp.is_clean() is False
+
+    def test_index_change_is_not_clean(self, tmp_path):
+        """Touching the index invalidates the stamp."""
+        git_dir, home = _make_repo(tmp_path)
+        stamp = CleanStamp(git_dir, home, path=tmp_path / "stamp")
+        stamp.record([".zshrc"])
+
+        os.utime(git_dir / "index", ns=(5, 5))
+
+        assert stamp.is_clean() is False
+
+    def test_branch_switch_is_not_clean(self, tmp_path):
+        """Pointing HEAD at another branch invalidates the stamp."""
+        git_dir, home = _make_repo(tmp_path)
+        (git_dir / "refs" / "heads" / "linux").write_text("def456\n")
+        stamp = CleanStamp(git_dir, home, path=tmp_path / "stamp")
+        stamp.record([".zshrc"])
+
+        (git_dir / "HEAD").write_text("ref: refs/heads/linux\n")
+
+        assert stamp.is_clean() is False
+
+    def test_racy_file_is_not_recorded(self, tmp_path):
+        """Files modified just now are not trusted by mtime."""
+        git_dir, home = _make_repo(tmp_path)
+        (home / ".vimrc").write_text("set nu\n")
+        stamp = CleanStamp(git_dir, home, path=tmp_path / "stamp")
+
+        assert stamp.record([".zshrc", ".vimrc"]) is False
+        assert stamp.is_clean() is False
+
+    def test_corrupt_stamp_is_not_clean(self, tmp_path):
+        """An unreadable stamp is treated as unknown state."""
+        git_dir, home = _make_repo(tmp_path)
+        stamp_path = tmp_path / "stamp"
+        stamp_path.write_text("not json")
+        stamp = CleanStamp(git_dir, home, path=stamp_path)
+
+        assert stamp.is_clean() is False
@@ -0,0 +1,47 @@
+"""Tests for status command helpers."""
+
+import json
+from unittest.mock import MagicMock
+
+from freckle.cli.status import _print_status_json
+
+
+class TestPrintStatusJson:
+    """Tests for _print_status_json function."""
+
+    def test_not_configured(self, capsys):
+        """Reports configured=false when there's no repo URL."""
+        config = MagicMock()
+        config.get.return_value = None
+
+        _print_status_json(config)
+
+        assert json.loads(capsys.readouterr().out) == {"configured": False}
+
+    def test_reports_repo_state(self, mocker, capsys):
+        """Summarizes the detailed status report."""
+        config = MagicMock()
+        config.get.return_value = "https://github.com/user/dotfiles.git"
+        dotfiles = MagicMock()
+        dotfiles.get_detailed_status.return_value = {
+            "initialized": True,
+            "branch": "main",
+            "local_commit": "abc1234",
+            "remote_commit": "def5678",
+            "ahead_count": 1,
+            "behind_count": 2,
+            "has_local_changes": True,
+            "changed_files": [".zshrc"],
+        }
+        mocker.patch(
+            "freckle.cli.status.get_dotfiles_manager", return_value=dotfiles
+        )
+
+        _print_status_json(config)
+
+        data = json.loads(capsys.readouterr().out)
+        assert data["branch"] == "main"
+        assert data["ahead"] == 1
+        assert data["behind"] == 2
+        assert data["dirty"] is True
+        assert data["changed_files"] == [".zshrc"]
@@ -1,13 +1,17 @@
 """Unit tests for the tools registry module."""
 
+import os
 import subprocess
 from unittest.mock import MagicMock, patch
 
+import pytest
+
 from freckle.tools_registry import (
     CURATED_SCRIPTS,
     PackageManager,
     ToolDefinition,
     ToolsRegistry,
+    VersionCache,
     get_tools_from_config,
 )
 
@@ -177,6 +181,119 @@ class TestPackageManager:
         assert pm.install("bad-package") is False
 
 
+class TestVersionCache:
+    """Tests for VersionCache."""
+
+    def _make_tool(self, tmp_path):
+        binary = tmp_path / "bin" / "mytool"
+        binary.parent.mkdir()
+        binary.write_text("#!/bin/sh\n")
+        binary.chmod(0o755)
+        tool = ToolDefinition(name="mytool")
+        return tool, binary
+
+    def test_reuses_version_until_binary_changes(self, tmp_path):
+        """Versions are probed again only after the binary changes."""
+        tool, binary = self._make_tool(tmp_path)
+        path = tmp_path / "versions.json"
+
+        with patch("shutil.which", return_value=str(binary)), patch.object(
+            ToolDefinition, "get_version", return_value="mytool 1.0"
+        ) as get_version:
+            cache = VersionCache(path=path)
+            assert cache.get_version(tool) == "mytool 1.0"
+            cache.save()
+
+            assert VersionCache(path=path).get_version(tool) == "mytool 1.0"
+            assert get_version.call_count == 1
+
+            binary.write_text("#!/bin/sh\n# upgraded\n")
+            assert VersionCache(path=path).get_version(tool) == "mytool 1.0"
+            assert get_version.call_count == 2
+
+    def test_keyed_on_symlink_target(self, tmp_path):
+        """A symlink retargeted to another install is probed again."""
+        old = tmp_path / "cellar" / "1.0" / "mytool"
+        new = tmp_path / "cellar" / "2.0" / "mytool"
+        for binary in (old, new):
+            binary.parent.mkdir(parents=True)
+            binary.write_text("#!/bin/sh\n")
+        # Same stat on both, so only the path tells them apart
+        os.utime(old, ns=(1_000_000_000, 1_000_000_000))
+        os.utime(new, ns=(1_000_000_000, 1_000_000_000))
+        link = tmp_path / "bin" / "mytool"
+        link.parent.mkdir()
+        link.symlink_to(old)
+        tool = ToolDefinition(name="mytool")
+        cache = VersionCache(path=tmp_path / "versions.json")
+
+        with patch("shutil.which", return_value=str(link)), patch.object(
+            ToolDefinition, "get_version", side_effect=["1.0", "2.0"]
+        ):
+            assert cache.get_version(tool) == "1.0"
+            link.unlink()
+            link.symlink_to(new)
+            assert cache.get_version(tool) == "2.0"
+
+    @pytest.mark.parametrize(
+        "shim_dir, target_name",
+        [("shims", "mytool"), ("bin", "mise"), ("bin", "volta-shim")],
+    )
+    def test_shims_are_not_cached(self, tmp_path, shim_dir, target_name):
+        """Shims keep their stat when the version behind them changes."""
+        dispatcher = tmp_path / "libexec" / target_name
+        dispatcher.parent.mkdir()
+        dispatcher.write_text("#!/bin/sh\n")
+        shim = tmp_path / shim_dir / "mytool"
+        shim.parent.mkdir()
+        shim.symlink_to(dispatcher)
+        tool = ToolDefinition(name="mytool")
+        path = tmp_path / "versions.json"
+
+        with patch("shutil.which", return_value=str(shim)), patch.object(
+            ToolDefinition, "get_version", side_effect=["1.0", "2.0"]
+        ):
+            cache = VersionCache(path=path)
+            assert cache.get_version(tool) == "1.0"
+            cache.save()
+            # e.g. 'mise use -g mytool@2' touched neither shim nor mise
+            assert VersionCache(path=path).get_version(tool) == "2.0"
+
+    def test_hardlinked_dispatcher_is_not_cached(self, tmp_path):
+        """rustup's hardlinked proxies are probed on every call."""
+        rustup = tmp_path / ".cargo" / "bin" / "rustup"
+        rustup.parent.mkdir(parents=True)
+        rustup.write_text("#!/bin/sh\n")
+        rustc = rustup.parent / "rustc"
+        os.link(rustup, rustc)
+        tool = ToolDefinition(name="rustc")
+        path = tmp_path / "versions.json"
+        which = {"rustc": str(rustc), "rustup": str(rustup)}.get
+
+        with patch("shutil.which", side_effect=which), patch.object(
+            ToolDefinition, "get_version", side_effect=["1.80", "1.81"]
+        ):
+            cache = VersionCache(path=path)
+            assert cache.get_version(tool) == "1.80"
+            cache.save()
+            # 'rustup default' switched toolchains; the proxy is unchanged
+            assert VersionCache(path=path).get_version(tool) == "1.81"
+
+    def test_missing_binary_is_not_cached(self, tmp_path):
+        """Tools not on PATH are probed directly and not remembered."""
+        tool = ToolDefinition(name="mytool")
+        path = tmp_path / "versions.json"
+
+        with patch("shutil.which", return_value=None), patch.object(
+            ToolDefinition, "get_version", return_value=None
+        ):
+            cache = VersionCache(path=path)
+            assert cache.get_version(tool) is None
+            cache.save()
+
+        assert not path.exists()
+
+
 class TestToolsRegistry:
     """Tests for ToolsRegistry class."""
 